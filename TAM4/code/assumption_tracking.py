@@ -5,12 +5,18 @@ This module implements tools for tracking, validating, and managing assumptions
 throughout the design process, as outlined in TAM4's vibe designing approach.
 """
 
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterable, List, Optional, Set, Any
 from enum import Enum
 import json
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class AssumptionStatus(Enum):
     """Status of an assumption in the validation process"""
@@ -22,6 +28,10 @@ class AssumptionStatus(Enum):
     UNKNOWN = "unknown"         # Cannot be validated
 
 
+# Serialized status strings, looked up directly instead of via Enum.value
+_STATUS_VALUES = {s: s.value for s in AssumptionStatus}
+
+
 class ValidationMethod(Enum):
     """Methods for validating assumptions"""
     USER_RESEARCH = "user_research"
@@ -33,7 +43,13 @@ class ValidationMethod(Enum):
     A_B_TESTING = "a_b_testing"
 
 
-@dataclass
+# Valid values for Evidence.confidence and Assumption.priority; range membership
+# also rejects non-integers such as 2.5
+_CONFIDENCE_RANGE = range(1, 6)
+_PRIORITY_RANGE = range(1, 4)
+
+
+@dataclass(slots=True)
 class Evidence:
     """A piece of evidence supporting or refuting an assumption"""
     description: str
@@ -44,15 +60,15 @@ class Evidence:
     url_or_reference: Optional[str] = None
     
     def __post_init__(self):
-        if not self.description.strip():
+        if not self.description or self.description.isspace():
             raise ValueError("Evidence description cannot be empty")
-        if not self.source.strip():
+        if not self.source or self.source.isspace():
             raise ValueError("Evidence source cannot be empty")
-        if self.confidence not in range(1, 6):
+        if self.confidence not in _CONFIDENCE_RANGE:
             raise ValueError("Confidence must be 1-5")
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationTask:
     """A task to validate a specific assumption"""
     description: str
@@ -71,7 +87,7 @@ class ValidationTask:
             self.evidence_found.extend(evidence)
 
 
-@dataclass  
+@dataclass(slots=True)
 class Assumption:
     """A trackable assumption with validation state"""
     id: str
@@ -85,18 +101,30 @@ class Assumption:
     created_at: datetime = field(default_factory=datetime.now)
     last_reviewed: Optional[datetime] = None
     dependencies: Set[str] = field(default_factory=set)  # IDs of related assumptions
+    # Running confidence totals, kept in step with `evidence` by add_evidence
+    _support_score: int = field(default=0, init=False, repr=False, compare=False)
+    _contradict_score: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if not self.id.strip():
+        if not self.id or self.id.isspace():
             raise ValueError("Assumption ID cannot be empty")
-        if not self.description.strip():
+        if not self.description or self.description.isspace():
             raise ValueError("Assumption description cannot be empty")
-        if self.priority not in range(1, 4):
+        if self.priority not in _PRIORITY_RANGE:
             raise ValueError("Priority must be 1-3")
+        for e in self.evidence:
+            if e.supports:
+                self._support_score += e.confidence
+            else:
+                self._contradict_score += e.confidence
     
     def add_evidence(self, evidence: Evidence):
         """Add evidence for or against this assumption"""
         self.evidence.append(evidence)
+        if evidence.supports:
+            self._support_score += evidence.confidence
+        else:
+            self._contradict_score += evidence.confidence
         self._update_status_from_evidence()
     
     def add_validation_task(self, task: ValidationTask):
@@ -109,28 +137,27 @@ class Assumption:
         """Update assumption status based on collected evidence"""
         if not self.evidence:
             return
-            
-        supporting_evidence = [e for e in self.evidence if e.supports]
-        contradicting_evidence = [e for e in self.evidence if not e.supports]
         
-        # Weight evidence by confidence
-        support_score = sum(e.confidence for e in supporting_evidence)
-        contradict_score = sum(e.confidence for e in contradicting_evidence)
+        # Evidence is weighted by confidence; totals are maintained incrementally
+        support_score = self._support_score
+        contradict_score = self._contradict_score
+        diff = support_score - contradict_score
         
-        if support_score > contradict_score * 2:
+        if diff > contradict_score:  # support > 2 * contradict
             self.status = AssumptionStatus.CONFIRMED
-        elif contradict_score > support_score * 2:
+        elif -diff > support_score:  # contradict > 2 * support
             self.status = AssumptionStatus.REFUTED
-        elif abs(support_score - contradict_score) <= 2:
+        elif -2 <= diff <= 2:
             self.status = AssumptionStatus.CONDITIONAL
         else:
             self.status = AssumptionStatus.VALIDATING
     
-    def is_stale(self, days: int = 30) -> bool:
+    def is_stale(self, days: int = 30, now: Optional[datetime] = None) -> bool:
         """Check if assumption hasn't been reviewed recently"""
         if not self.last_reviewed:
             return True
-        return datetime.now() - self.last_reviewed > timedelta(days=days)
+        now = now or datetime.now()
+        return now - self.last_reviewed > timedelta(days=days)
     
     def get_validation_progress(self) -> float:
         """Get percentage of validation tasks completed"""
@@ -160,8 +187,7 @@ class AssumptionRegistry:
     
     def remove_assumption(self, assumption_id: str):
         """Remove an assumption from registry"""
-        if assumption_id in self.assumptions:
-            del self.assumptions[assumption_id]
+        self.assumptions.pop(assumption_id, None)
     
     def get_by_status(self, status: AssumptionStatus) -> List[Assumption]:
         """Get all assumptions with specific status"""
@@ -173,7 +199,8 @@ class AssumptionRegistry:
     
     def get_stale_assumptions(self, days: int = 30) -> List[Assumption]:
         """Get assumptions that haven't been reviewed recently"""
-        return [a for a in self.assumptions.values() if a.is_stale(days)]
+        now = datetime.now()
+        return [a for a in self.assumptions.values() if a.is_stale(days, now)]
     
     def get_critical_unvalidated(self) -> List[Assumption]:
         """Get critical assumptions that are unvalidated"""
@@ -205,62 +232,88 @@ class AssumptionRegistry:
     
     def add_dependency(self, assumption_id: str, depends_on: str):
         """Add dependency between assumptions"""
-        if assumption_id in self.assumptions and depends_on in self.assumptions:
-            self.assumptions[assumption_id].dependencies.add(depends_on)
+        assumptions = self.assumptions
+        assumption = assumptions.get(assumption_id)
+        if assumption is not None and depends_on in assumptions:
+            assumption.dependencies.add(depends_on)
+    
+    def add_dependencies(self, assumption_id: str, depends_on: Iterable[str]):
+        """Add several dependencies at once, ignoring IDs not in the registry"""
+        assumption = self.assumptions.get(assumption_id)
+        if assumption is not None:
+            assumption.dependencies |= self.assumptions.keys() & set(depends_on)
     
     def get_dependency_chain(self, assumption_id: str) -> Set[str]:
         """Get all assumptions this one depends on (recursively)"""
         if assumption_id not in self.assumptions:
             return set()
         
+        assumptions = self.assumptions
         chain = set()
-        to_check = {assumption_id}
+        to_check = deque([assumption_id])
         
         while to_check:
-            current = to_check.pop()
-            if current in self.assumptions:
-                deps = self.assumptions[current].dependencies
-                new_deps = deps - chain  # Avoid cycles
-                chain.update(deps)
-                to_check.update(new_deps)
+            node = assumptions.get(to_check.popleft())
+            if node is None:
+                continue
+            for dep in node.dependencies:
+                if dep not in chain:  # Visit each node once; also stops cycles
+                    chain.add(dep)
+                    to_check.append(dep)
         
         return chain
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert registry to dictionary for serialization"""
+        # One clock read for the whole export; same rule as is_stale(days=30)
+        threshold = datetime.now() - timedelta(days=30)
+        status_values = _STATUS_VALUES
+        assumptions = {}
+        stale_count = 0
+        status_counts = Counter()
+        for aid, a in self.assumptions.items():
+            last_reviewed = a.last_reviewed
+            is_stale = last_reviewed is None or last_reviewed < threshold
+            stale_count += is_stale
+            status_counts[a.status] += 1
+            dependencies = a.dependencies
+            assumptions[aid] = {
+                'id': a.id,
+                'description': a.description,
+                'context': a.context,
+                'impact_if_wrong': a.impact_if_wrong,
+                'priority': a.priority,
+                'status': status_values[a.status],
+                'evidence_count': len(a.evidence),
+                'validation_progress': a.get_validation_progress(),
+                'is_stale': is_stale,
+                'dependencies': list(dependencies) if dependencies else [],
+                'created_at': a.created_at.isoformat(),
+                'last_reviewed': last_reviewed.isoformat() if last_reviewed else None
+            }
         return {
             'project_name': self.project_name,
             'created_at': self.created_at.isoformat(),
-            'assumptions': {
-                aid: {
-                    'id': a.id,
-                    'description': a.description,
-                    'context': a.context,
-                    'impact_if_wrong': a.impact_if_wrong,
-                    'priority': a.priority,
-                    'status': a.status.value,
-                    'evidence_count': len(a.evidence),
-                    'validation_progress': a.get_validation_progress(),
-                    'is_stale': a.is_stale(),
-                    'dependencies': list(a.dependencies),
-                    'created_at': a.created_at.isoformat(),
-                    'last_reviewed': a.last_reviewed.isoformat() if a.last_reviewed else None
-                } for aid, a in self.assumptions.items()
-            },
+            'assumptions': assumptions,
             'summary': {
                 'total_assumptions': len(self.assumptions),
                 'by_status': {
-                    status.value: len(self.get_by_status(status)) 
-                    for status in AssumptionStatus
+                    value: status_counts[status]
+                    for status, value in status_values.items()
                 },
                 'critical_unvalidated': len(self.get_critical_unvalidated()),
-                'stale_assumptions': len(self.get_stale_assumptions())
+                'stale_assumptions': stale_count
             }
         }
     
-    def to_json(self) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+    def to_json(self, pretty: bool = True) -> str:
+        """Convert to JSON string (compact when pretty=False)"""
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
 
 
 def create_sample_registry() -> AssumptionRegistry:
@@ -6,11 +6,12 @@ supporting the TAM4 approach of using AI to discover and compare solution approa
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Any, Tuple
 from enum import Enum
 import json
 from datetime import datetime
 import math
+from operator import itemgetter
 
 
 class DesignDimension(Enum):
@@ -25,9 +26,17 @@ class DesignDimension(Enum):
     RELIABILITY = "reliability"
     FLEXIBILITY = "flexibility"
     TIME_TO_MARKET = "time_to_market"
+    
+    # Members are singletons compared by identity, so hash by identity too;
+    # Enum's default hashes the member name in Python on every dict/set lookup
+    __hash__ = object.__hash__
+
 
+# Valid values for DesignScore.score and DesignScore.confidence
+_SCORE_RANGE = range(1, 6)
 
-@dataclass
+
+@dataclass(slots=True)
 class DesignScore:
     """Score for a design along various dimensions"""
     dimension: DesignDimension
@@ -36,13 +45,13 @@ class DesignScore:
     rationale: str  # Why we gave this score
     
     def __post_init__(self):
-        if self.score not in range(1, 6):
+        if self.score not in _SCORE_RANGE:
             raise ValueError("Score must be 1-5")
-        if self.confidence not in range(1, 6):
+        if self.confidence not in _SCORE_RANGE:
             raise ValueError("Confidence must be 1-5")
 
 
-@dataclass 
+@dataclass(slots=True)
 class DesignPattern:
     """A reusable design pattern or approach"""
     name: str
@@ -58,14 +67,14 @@ class DesignPattern:
         return self.typical_scores.get(dimension)
 
 
-@dataclass
+@dataclass(slots=True)
 class DesignAlternative:
     """A specific design alternative being explored"""
     id: str
     name: str
     description: str
     approach: str  # High-level approach description
-    scores: List[DesignScore] = field(default_factory=list)
+    scores: Dict[DesignDimension, DesignScore] = field(default_factory=dict)
     implementation_notes: str = ""
     risks: List[str] = field(default_factory=list)
     assumptions: List[str] = field(default_factory=list)
@@ -86,39 +95,49 @@ class DesignAlternative:
             confidence=confidence,
             rationale=rationale
         )
-        # Remove existing score for this dimension
-        self.scores = [s for s in self.scores if s.dimension != dimension]
-        self.scores.append(design_score)
+        # Replaces any existing score for this dimension
+        self.scores[dimension] = design_score
+    
+    def add_scores(self, items: Iterable[Tuple[DesignDimension, int, int, str]]):
+        """Add several (dimension, score, confidence, rationale) scores at once"""
+        # Every score is validated before any is stored, so a bad item adds nothing
+        design_scores = [DesignScore(*item) for item in items]
+        self.scores.update((design_score.dimension, design_score) for design_score in design_scores)
     
     def get_score(self, dimension: DesignDimension) -> Optional[DesignScore]:
         """Get score for specific dimension"""
-        for score in self.scores:
-            if score.dimension == dimension:
-                return score
-        return None
+        return self.scores.get(dimension)
     
     def get_overall_score(self, weights: Dict[DesignDimension, float] = None) -> float:
         """Calculate weighted overall score"""
         if not self.scores:
             return 0.0
         
-        if weights is None:
-            # Equal weights for all dimensions
-            total_score = sum(s.score * s.confidence for s in self.scores)
-            total_confidence = sum(s.confidence for s in self.scores)
-            return total_score / total_confidence if total_confidence > 0 else 0.0
-        
         weighted_score = 0.0
         total_weight = 0.0
         
-        for score in self.scores:
-            weight = weights.get(score.dimension, 0.0)
-            weighted_score += score.score * score.confidence * weight
-            total_weight += score.confidence * weight
+        if weights is None:
+            # Equal weights for all dimensions
+            for score in self.scores.values():
+                weighted_score += score.score * score.confidence
+                total_weight += score.confidence
+        else:
+            get_weight = weights.get
+            for dimension, score in self.scores.items():
+                weight = score.confidence * get_weight(dimension, 0.0)
+                weighted_score += score.score * weight
+                total_weight += weight
         
         return weighted_score / total_weight if total_weight > 0 else 0.0
 
 
+# Score, confidence and rationale reported for a dimension an alternative has not scored
+_NO_SCORE = (None, None, None)
+
+# Typical score at which a pattern is suggested to shore up a weak dimension
+STRONG_PATTERN_SCORE = 4
+
+
 class DesignExplorer:
     """Tool for systematic exploration and comparison of design alternatives"""
     
@@ -133,6 +152,15 @@ class DesignExplorer:
         """Add a design pattern to the knowledge base"""
         self.patterns[pattern.name] = pattern
     
+    def _strong_patterns(self) -> Dict[DesignDimension, List[str]]:
+        """Names of patterns scoring >= STRONG_PATTERN_SCORE per dimension, in pattern order"""
+        strong_patterns: Dict[DesignDimension, List[str]] = {}
+        for pattern in self.patterns.values():
+            for dimension, typical_score in pattern.typical_scores.items():
+                if typical_score >= STRONG_PATTERN_SCORE:
+                    strong_patterns.setdefault(dimension, []).append(pattern.name)
+        return strong_patterns
+    
     def add_alternative(self, alternative: DesignAlternative):
         """Add a design alternative for exploration"""
         self.alternatives[alternative.id] = alternative
@@ -160,12 +188,13 @@ class DesignExplorer:
     
     def rank_alternatives(self) -> List[Tuple[str, float, DesignAlternative]]:
         """Rank alternatives by overall score"""
-        ranked = []
-        for alt_id, alternative in self.alternatives.items():
-            score = alternative.get_overall_score(self.evaluation_criteria)
-            ranked.append((alt_id, score, alternative))
-        
-        return sorted(ranked, key=lambda x: x[1], reverse=True)
+        weights = self.evaluation_criteria
+        ranked = [
+            (alt_id, alternative.get_overall_score(weights), alternative)
+            for alt_id, alternative in self.alternatives.items()
+        ]
+        ranked.sort(key=itemgetter(1), reverse=True)
+        return ranked
     
     def compare_alternatives(self, alt_id1: str, alt_id2: str) -> Dict[str, Any]:
         """Compare two alternatives across all dimensions"""
@@ -186,31 +215,36 @@ class DesignExplorer:
         }
         
         # Compare each dimension
-        all_dimensions = set()
-        for alt in [alt1, alt2]:
-            all_dimensions.update(s.dimension for s in alt.scores)
+        all_dimensions = alt1.scores.keys() | alt2.scores.keys()
+        
+        dimension_comparison = comparison['dimension_comparison']
+        scores1 = alt1.scores
+        scores2 = alt2.scores
         
         for dimension in all_dimensions:
-            score1 = alt1.get_score(dimension)
-            score2 = alt2.get_score(dimension)
-            
-            comparison['dimension_comparison'][dimension.value] = {
-                'alt1_score': score1.score if score1 else None,
-                'alt1_confidence': score1.confidence if score1 else None,
-                'alt1_rationale': score1.rationale if score1 else None,
-                'alt2_score': score2.score if score2 else None,
-                'alt2_confidence': score2.confidence if score2 else None,
-                'alt2_rationale': score2.rationale if score2 else None,
-                'winner': None
-            }
+            score1 = scores1.get(dimension)
+            score2 = scores2.get(dimension)
             
+            winner = None
             if score1 and score2:
                 if score1.score > score2.score:
-                    comparison['dimension_comparison'][dimension.value]['winner'] = alt_id1
+                    winner = alt_id1
                 elif score2.score > score1.score:
-                    comparison['dimension_comparison'][dimension.value]['winner'] = alt_id2
+                    winner = alt_id2
                 else:
-                    comparison['dimension_comparison'][dimension.value]['winner'] = 'tie'
+                    winner = 'tie'
+            
+            s1, c1, r1 = (score1.score, score1.confidence, score1.rationale) if score1 else _NO_SCORE
+            s2, c2, r2 = (score2.score, score2.confidence, score2.rationale) if score2 else _NO_SCORE
+            dimension_comparison[dimension.value] = {
+                'alt1_score': s1,
+                'alt1_confidence': c1,
+                'alt1_rationale': r1,
+                'alt2_score': s2,
+                'alt2_confidence': c2,
+                'alt2_rationale': r2,
+                'winner': winner
+            }
         
         return comparison
     
@@ -222,17 +256,16 @@ class DesignExplorer:
         
         suggestions = []
         low_score_threshold = 3
+        # Built from the current patterns once per call, not once per low score
+        strong_by_dimension = None
         
-        for score in alternative.scores:
+        for score in alternative.scores.values():
             if score.score <= low_score_threshold:
                 # Look for patterns that are strong in this dimension
                 dimension = score.dimension
-                strong_patterns = []
-                
-                for pattern in self.patterns.values():
-                    typical_score = pattern.get_typical_score(dimension)
-                    if typical_score and typical_score >= 4:
-                        strong_patterns.append(pattern.name)
+                if strong_by_dimension is None:
+                    strong_by_dimension = self._strong_patterns()
+                strong_patterns = strong_by_dimension.get(dimension)
                 
                 if strong_patterns:
                     suggestion = f"To improve {dimension.value}: Consider patterns like {', '.join(strong_patterns[:3])}"
@@ -263,37 +296,30 @@ class DesignExplorer:
             approach="Hybrid approach taking best elements from multiple alternatives"
         )
         
-        # For each dimension, take the best score
-        all_dimensions = set()
+        # For each dimension, take the best score; the earliest source wins ties
+        best: Dict[DesignDimension, Tuple[DesignScore, str]] = {}
         for alt in source_alts:
-            all_dimensions.update(s.dimension for s in alt.scores)
+            for dimension, score in alt.scores.items():
+                current = best.get(dimension)
+                if current is None or score.score > current[0].score:
+                    best[dimension] = (score, alt.name)
         
-        for dimension in all_dimensions:
-            best_score = None
-            source_alt = None
-            
-            for alt in source_alts:
-                score = alt.get_score(dimension)
-                if score and (not best_score or score.score > best_score.score):
-                    best_score = score
-                    source_alt = alt.name
-            
-            if best_score:
-                hybrid.add_score(
-                    dimension,
-                    best_score.score,
-                    best_score.confidence,
-                    f"From {source_alt}: {best_score.rationale}"
-                )
+        for dimension, (best_score, source_alt) in best.items():
+            hybrid.scores[dimension] = DesignScore(
+                dimension,
+                best_score.score,
+                best_score.confidence,
+                f"From {source_alt}: {best_score.rationale}"
+            )
         
         # Combine risks and assumptions
         for alt in source_alts:
             hybrid.risks.extend(alt.risks)
             hybrid.assumptions.extend(alt.assumptions)
         
-        # Remove duplicates
-        hybrid.risks = list(set(hybrid.risks))
-        hybrid.assumptions = list(set(hybrid.assumptions))
+        # Remove duplicates, keeping first-seen order
+        hybrid.risks = list(dict.fromkeys(hybrid.risks))
+        hybrid.assumptions = list(dict.fromkeys(hybrid.assumptions))
         
         self.add_alternative(hybrid)
         return hybrid
@@ -317,7 +343,7 @@ class DesignExplorer:
                             'score': s.score,
                             'confidence': s.confidence,
                             'rationale': s.rationale
-                        } for s in alt.scores
+                        } for s in alt.scores.values()
                     ],
                     'risks': alt.risks,
                     'assumptions': alt.assumptions,
@@ -422,11 +448,13 @@ def create_sample_explorer() -> DesignExplorer:
         "Store user credentials, validate on login, maintain sessions"
     )
     
-    traditional_auth.add_score(DesignDimension.SECURITY, 3, 4, "Standard security, prone to password attacks")
-    traditional_auth.add_score(DesignDimension.USER_EXPERIENCE, 3, 5, "Familiar but requires password management")
-    traditional_auth.add_score(DesignDimension.MAINTAINABILITY, 4, 4, "Simple to implement and maintain")
-    traditional_auth.add_score(DesignDimension.SCALABILITY, 4, 4, "Scales well with proper session handling")
-    traditional_auth.add_score(DesignDimension.TIME_TO_MARKET, 5, 5, "Quick to implement")
+    traditional_auth.add_scores([
+        (DesignDimension.SECURITY, 3, 4, "Standard security, prone to password attacks"),
+        (DesignDimension.USER_EXPERIENCE, 3, 5, "Familiar but requires password management"),
+        (DesignDimension.MAINTAINABILITY, 4, 4, "Simple to implement and maintain"),
+        (DesignDimension.SCALABILITY, 4, 4, "Scales well with proper session handling"),
+        (DesignDimension.TIME_TO_MARKET, 5, 5, "Quick to implement"),
+    ])
     traditional_auth.risks.extend([
         "Password breaches", "Credential stuffing attacks", "Password reset vulnerabilities"
     ])
@@ -438,11 +466,13 @@ def create_sample_explorer() -> DesignExplorer:
         "Redirect to OAuth provider, handle callback, store user info"
     )
     
-    oauth_sso.add_score(DesignDimension.SECURITY, 4, 4, "Offloads security to proven providers")
-    oauth_sso.add_score(DesignDimension.USER_EXPERIENCE, 4, 4, "Convenient, no new passwords")
-    oauth_sso.add_score(DesignDimension.MAINTAINABILITY, 4, 3, "Less auth code but OAuth complexity")
-    oauth_sso.add_score(DesignDimension.SCALABILITY, 5, 4, "Providers handle scale")
-    oauth_sso.add_score(DesignDimension.TIME_TO_MARKET, 4, 4, "Quick integration but OAuth setup needed")
+    oauth_sso.add_scores([
+        (DesignDimension.SECURITY, 4, 4, "Offloads security to proven providers"),
+        (DesignDimension.USER_EXPERIENCE, 4, 4, "Convenient, no new passwords"),
+        (DesignDimension.MAINTAINABILITY, 4, 3, "Less auth code but OAuth complexity"),
+        (DesignDimension.SCALABILITY, 5, 4, "Providers handle scale"),
+        (DesignDimension.TIME_TO_MARKET, 4, 4, "Quick integration but OAuth setup needed"),
+    ])
     oauth_sso.risks.extend([
         "Provider downtime", "OAuth token vulnerabilities", "User locked to specific providers"
     ])
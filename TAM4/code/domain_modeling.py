@@ -6,10 +6,29 @@ focusing on tools for deeper problem modeling and design thinking before code ge
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Any, Callable
-from enum import Enum
+from typing import Dict, FrozenSet, List, Optional, Any, Callable
+from enum import Enum, IntEnum
 import json
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Impact(IntEnum):
+    """Severity of an edge case's impact, used as its risk multiplier"""
+    MINIMAL = 1
+    LOW = 2
+    MEDIUM = 3
+    HIGH = 4
+    CRITICAL = 5
+
+
+# Impact for each recognised EdgeCase impact string; anything else counts as medium
+_IMPACT_LEVELS = MappingProxyType({level.name.lower(): level for level in Impact})
 
 
 class EntityLifecycleState(Enum):
@@ -19,9 +38,24 @@ class EntityLifecycleState(Enum):
     SUSPENDED = "suspended"
     ARCHIVED = "archived"
     DELETED = "deleted"
+    
+    # Members are singletons compared by identity, so hash by identity too;
+    # Enum's default hashes the member name in Python on every dict/set lookup
+    __hash__ = object.__hash__
+
+
+# One bit per lifecycle state, used to pack a state's allowed targets into an int
+_STATE_BIT = {state: 1 << i for i, state in enumerate(EntityLifecycleState)}
 
+# States given to an EntityLifecycle created without any; shared by all of them
+_DEFAULT_STATES = frozenset({
+    EntityLifecycleState.CREATED,
+    EntityLifecycleState.ACTIVE,
+    EntityLifecycleState.ARCHIVED
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class DomainInvariant:
     """A business rule or constraint that must always hold true"""
     name: str
@@ -37,29 +71,40 @@ class DomainInvariant:
             raise ValueError("Invariant description cannot be empty")
 
 
-@dataclass 
+@dataclass(slots=True)
 class EdgeCase:
     """A potential edge case or failure mode"""
     scenario: str
-    impact: str  # What happens if this occurs
+    impact: str  # What happens if this occurs; an Impact is stored as its lowercase name
     likelihood: int  # 1-5 scale
     mitigation: Optional[str] = None
+    # Severity of `impact`, resolved whenever impact is assigned
+    _impact_level: Impact = field(init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        if name == 'impact':
+            if isinstance(value, Impact):
+                level, value = value, value.name.lower()
+            elif isinstance(value, str):
+                level = _IMPACT_LEVELS.get(value.lower(), Impact.MEDIUM)
+            else:
+                # Anything else is an unrecognised severity, like an unknown string
+                level = Impact.MEDIUM
+            object.__setattr__(self, '_impact_level', level)
+        object.__setattr__(self, name, value)
     
     def risk_score(self) -> int:
         """Calculate risk score based on likelihood and impact severity"""
-        impact_levels = {
-            "critical": 5, "high": 4, "medium": 3, "low": 2, "minimal": 1
-        }
-        severity = impact_levels.get(self.impact.lower(), 3)
-        return self.likelihood * severity
+        return self.likelihood * self._impact_level
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityLifecycle:
     """Models the lifecycle and state transitions of a domain entity"""
     entity_name: str
-    states: Set[EntityLifecycleState] = field(default_factory=set)
-    transitions: Dict[str, Set[EntityLifecycleState]] = field(default_factory=dict)
+    states: FrozenSet[EntityLifecycleState] = field(default_factory=frozenset)
+    # Allowed targets per source state value, as a bitmask of _STATE_BIT entries
+    transitions: Dict[str, int] = field(default_factory=dict)
     business_events: List[str] = field(default_factory=list)
     
     def __post_init__(self):
@@ -68,24 +113,21 @@ class EntityLifecycle:
         
         # Add default states if none provided
         if not self.states:
-            self.states = {
-                EntityLifecycleState.CREATED,
-                EntityLifecycleState.ACTIVE,
-                EntityLifecycleState.ARCHIVED
-            }
+            self.states = _DEFAULT_STATES
+        elif not isinstance(self.states, frozenset):
+            self.states = frozenset(self.states)
     
     def add_transition(self, from_state: EntityLifecycleState, to_state: EntityLifecycleState):
         """Add a valid state transition"""
-        if from_state not in self.transitions:
-            self.transitions[from_state.value] = set()
-        self.transitions[from_state.value].add(to_state)
+        key = from_state.value
+        self.transitions[key] = self.transitions.get(key, 0) | _STATE_BIT[to_state]
     
     def can_transition(self, from_state: EntityLifecycleState, to_state: EntityLifecycleState) -> bool:
         """Check if a state transition is valid"""
-        return to_state in self.transitions.get(from_state.value, set())
+        return bool(self.transitions.get(from_state.value, 0) & _STATE_BIT[to_state])
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainModel:
     """A comprehensive model of a problem domain before coding"""
     name: str
@@ -126,7 +168,11 @@ class DomainModel:
     
     def get_high_risk_cases(self, threshold: int = 15) -> List[EdgeCase]:
         """Get edge cases above risk threshold"""
-        return [case for case in self.edge_cases if case.risk_score() >= threshold]
+        # Inlines EdgeCase.risk_score to avoid a method call per case
+        return [
+            case for case in self.edge_cases
+            if case.likelihood * case._impact_level >= threshold
+        ]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -154,7 +200,10 @@ class DomainModel:
                 {
                     'name': entity.entity_name,
                     'states': [state.value for state in entity.states],
-                    'transitions': {k: [s.value for s in v] for k, v in entity.transitions.items()},
+                    'transitions': {
+                        k: [state.value for state, bit in _STATE_BIT.items() if mask & bit]
+                        for k, mask in entity.transitions.items()
+                    },
                     'business_events': entity.business_events
                 } for entity in self.entities
             ],
@@ -164,12 +213,17 @@ class DomainModel:
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict(), indent=2)
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2, ensure_ascii=False)
 
 
 class DomainModelBuilder:
     """Builder pattern for creating domain models step by step"""
     
+    __slots__ = ('model',)
+    
     def __init__(self, name: str, description: str):
         self.model = DomainModel(name=name, description=description)
     
@@ -212,13 +266,15 @@ class DomainModelBuilder:
 class EntityBuilder:
     """Builder for entity lifecycles within a domain model"""
     
+    __slots__ = ('parent_builder', 'entity')
+    
     def __init__(self, parent_builder: DomainModelBuilder, entity_name: str):
         self.parent_builder = parent_builder
         self.entity = EntityLifecycle(entity_name=entity_name)
     
     def with_states(self, *states: EntityLifecycleState) -> 'EntityBuilder':
         """Add lifecycle states"""
-        self.entity.states.update(states)
+        self.entity.states = self.entity.states.union(states)
         return self
     
     def with_transition(self, from_state: EntityLifecycleState, to_state: EntityLifecycleState) -> 'EntityBuilder':
@@ -282,4 +338,4 @@ def create_authentication_model() -> DomainModel:
             .with_business_event("PasswordChanged")
             .with_business_event("AccountLocked")
             .and_model()
-        .build())
\ No newline at end of file
+        .build())
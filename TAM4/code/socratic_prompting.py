@@ -6,13 +6,18 @@ providing frameworks for using AI to challenge assumptions and explore design al
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Any, Iterable, Tuple
 from enum import Enum
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class QuestionType(Enum):
+
+class QuestionType(str, Enum):
     """Types of Socratic questions for design exploration"""
     ASSUMPTION_CHALLENGE = "assumption_challenge"  # Challenge what we think we know
     ALTERNATIVE_EXPLORATION = "alternative_exploration"  # Explore different approaches
@@ -22,7 +27,11 @@ class QuestionType(Enum):
     SIMPLIFICATION = "simplification"  # Find simpler approaches
 
 
-@dataclass
+# Plain-str form of each question type for to_dict, avoiding a .value lookup per question
+_QTYPE_VALUE = {question_type: question_type.value for question_type in QuestionType}
+
+
+@dataclass(slots=True)
 class SocraticQuestion:
     """A structured question for design exploration"""
     question: str
@@ -38,7 +47,7 @@ class SocraticQuestion:
             raise ValueError("Question context cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class DesignAlternative:
     """A design alternative discovered through Socratic questioning"""
     name: str
@@ -56,7 +65,7 @@ class DesignAlternative:
             raise ValueError("Complexity score must be 1-5")
 
 
-@dataclass
+@dataclass(slots=True)
 class AssumptionChallenge:
     """A challenge to a design assumption"""
     assumption: str
@@ -71,6 +80,13 @@ class AssumptionChallenge:
         return len(self.evidence_for) >= 2 and self.confidence_level >= 4
 
 
+# Expected outcome shared by every generated question of each category
+_ASSUMPTION_OUTCOME = "Evidence for/against the assumption, alternative perspectives"
+_ALTERNATIVE_OUTCOME = "Multiple different solution approaches with trade-offs"
+_EDGE_CASE_OUTCOME = "Potential failure modes, unusual scenarios, boundary conditions"
+_CONSTRAINT_OUTCOME = "Justification for constraints, flexibility analysis"
+
+
 class SocraticPromptGenerator:
     """Generates structured prompts for AI-assisted Socratic questioning"""
     
@@ -102,62 +118,65 @@ class SocraticPromptGenerator:
         "How did we arrive at the constraint '{constraint}' - is it still valid?",
     ]
     
-    def generate_assumption_questions(self, assumptions: List[str]) -> List[SocraticQuestion]:
-        """Generate questions to challenge assumptions"""
+    @staticmethod
+    def _build_questions(templates: List[str], values: Iterable[str], field_name: str,
+                         question_type: QuestionType, context_prefix: str,
+                         expected_outcome: str, **extra: str) -> List[SocraticQuestion]:
+        """One question per (value, template) pair, grouped by value"""
         questions = []
-        for assumption in assumptions:
-            for template in self.ASSUMPTION_TEMPLATES:
-                question = SocraticQuestion(
-                    question=template.format(assumption=assumption),
-                    question_type=QuestionType.ASSUMPTION_CHALLENGE,
-                    context=f"Challenging assumption: {assumption}",
-                    expected_outcome="Evidence for/against the assumption, alternative perspectives"
-                )
-                questions.append(question)
+        for value in values:
+            context = f"{context_prefix}{value}"
+            fields = {field_name: value, **extra}
+            questions.extend([
+                SocraticQuestion(template.format(**fields), question_type, context, expected_outcome)
+                for template in templates
+            ])
         return questions
     
-    def generate_alternative_questions(self, problem_statement: str) -> List[SocraticQuestion]:
+    @classmethod
+    def generate_assumption_questions(cls, assumptions: List[str]) -> List[SocraticQuestion]:
+        """Generate questions to challenge assumptions"""
+        return cls._build_questions(
+            cls.ASSUMPTION_TEMPLATES, assumptions, "assumption", QuestionType.ASSUMPTION_CHALLENGE,
+            "Challenging assumption: ", _ASSUMPTION_OUTCOME
+        )
+    
+    @classmethod
+    def generate_alternative_questions(cls, problem_statement: str) -> List[SocraticQuestion]:
         """Generate questions to explore alternatives"""
-        questions = []
-        for template in self.ALTERNATIVE_TEMPLATES:
-            question = SocraticQuestion(
-                question=template.format(problem=problem_statement),
-                question_type=QuestionType.ALTERNATIVE_EXPLORATION,
-                context=f"Exploring alternatives for: {problem_statement}",
-                expected_outcome="Multiple different solution approaches with trade-offs"
-            )
-            questions.append(question)
-        return questions
+        return cls._build_questions(
+            cls.ALTERNATIVE_TEMPLATES, (problem_statement,), "problem", QuestionType.ALTERNATIVE_EXPLORATION,
+            "Exploring alternatives for: ", _ALTERNATIVE_OUTCOME
+        )
     
-    def generate_edge_case_questions(self, problem_statement: str) -> List[SocraticQuestion]:
+    @classmethod
+    def generate_edge_case_questions(cls, problem_statement: str) -> List[SocraticQuestion]:
         """Generate questions to discover edge cases"""
-        questions = []
-        for template in self.EDGE_CASE_TEMPLATES:
-            question = SocraticQuestion(
-                question=template.format(problem=problem_statement),
-                question_type=QuestionType.EDGE_CASE_DISCOVERY,
-                context=f"Finding edge cases for: {problem_statement}",
-                expected_outcome="Potential failure modes, unusual scenarios, boundary conditions"
-            )
-            questions.append(question)
-        return questions
+        return cls._build_questions(
+            cls.EDGE_CASE_TEMPLATES, (problem_statement,), "problem", QuestionType.EDGE_CASE_DISCOVERY,
+            "Finding edge cases for: ", _EDGE_CASE_OUTCOME
+        )
     
-    def generate_constraint_questions(self, constraints: List[str]) -> List[SocraticQuestion]:
+    @classmethod
+    def generate_constraint_questions(cls, constraints: List[str]) -> List[SocraticQuestion]:
         """Generate questions to validate constraints"""
-        questions = []
-        for constraint in constraints:
-            for template in self.CONSTRAINT_TEMPLATES:
-                question = SocraticQuestion(
-                    question=template.format(constraint=constraint, constraints=", ".join(constraints)),
-                    question_type=QuestionType.CONSTRAINT_VALIDATION,
-                    context=f"Validating constraint: {constraint}",
-                    expected_outcome="Justification for constraints, flexibility analysis"
-                )
-                questions.append(question)
-        return questions
+        return cls._build_questions(
+            cls.CONSTRAINT_TEMPLATES, constraints, "constraint", QuestionType.CONSTRAINT_VALIDATION,
+            "Validating constraint: ", _CONSTRAINT_OUTCOME, constraints=", ".join(constraints)
+        )
+
+
+# Session attribute each generated question type is built from, and the
+# generator classmethod that builds it, in the order generate_questions emits them
+_QUESTION_SOURCES = {
+    QuestionType.ASSUMPTION_CHALLENGE: ('assumptions', SocraticPromptGenerator.generate_assumption_questions),
+    QuestionType.ALTERNATIVE_EXPLORATION: ('problem_statement', SocraticPromptGenerator.generate_alternative_questions),
+    QuestionType.EDGE_CASE_DISCOVERY: ('problem_statement', SocraticPromptGenerator.generate_edge_case_questions),
+    QuestionType.CONSTRAINT_VALIDATION: ('constraints', SocraticPromptGenerator.generate_constraint_questions),
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class SocraticSession:
     """A complete Socratic questioning session for design exploration"""
     problem_statement: str
@@ -168,16 +187,23 @@ class SocraticSession:
     challenges: List[AssumptionChallenge] = field(default_factory=list)
     insights: List[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
+    # Generated question fields per type, with the input they were generated from;
+    # only the immutable strings are kept, so every lookup gets its own questions
+    _questions_by_type: Dict[QuestionType, Tuple[Any, Tuple[Tuple[str, str, str, int], ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     
     def add_assumption(self, assumption: str):
         """Add an assumption to be challenged"""
-        if assumption.strip() not in self.assumptions:
-            self.assumptions.append(assumption.strip())
+        assumption = assumption.strip()
+        if assumption not in self.assumptions:
+            self.assumptions.append(assumption)
     
     def add_constraint(self, constraint: str):
         """Add a constraint to be validated"""
-        if constraint.strip() not in self.constraints:
-            self.constraints.append(constraint.strip())
+        constraint = constraint.strip()
+        if constraint not in self.constraints:
+            self.constraints.append(constraint)
     
     def add_alternative(self, alternative: DesignAlternative):
         """Add a discovered design alternative"""
@@ -192,32 +218,58 @@ class SocraticSession:
         if insight.strip():
             self.insights.append(insight.strip())
     
+    def _ensure(self, question_type: QuestionType) -> List[SocraticQuestion]:
+        """Fresh questions of one type; their text is regenerated only when the input has changed"""
+        source = _QUESTION_SOURCES.get(question_type)
+        if source is None:
+            return []
+        attr, generate = source
+        key = getattr(self, attr)
+        if isinstance(key, list):
+            key = tuple(key)
+        
+        cached = self._questions_by_type.get(question_type)
+        if cached is not None and cached[0] == key:
+            return [
+                SocraticQuestion(question, question_type, context, expected_outcome, priority)
+                for question, context, expected_outcome, priority in cached[1]
+            ]
+        questions = generate(key)
+        self._questions_by_type[question_type] = (key, tuple(
+            (q.question, q.context, q.expected_outcome, q.priority) for q in questions
+        ))
+        return questions
+    
+    def _generate_all(self) -> List[SocraticQuestion]:
+        """Fresh questions of every generated type, in generate_questions order"""
+        questions = []
+        for question_type in _QUESTION_SOURCES:
+            questions.extend(self._ensure(question_type))
+        return questions
+    
     def generate_questions(self) -> List[SocraticQuestion]:
         """Generate all Socratic questions for this session"""
-        generator = SocraticPromptGenerator()
-        questions = []
-        
-        # Generate assumption challenges
-        questions.extend(generator.generate_assumption_questions(self.assumptions))
-        
-        # Generate alternative explorations
-        questions.extend(generator.generate_alternative_questions(self.problem_statement))
-        
-        # Generate edge case discoveries
-        questions.extend(generator.generate_edge_case_questions(self.problem_statement))
-        
-        # Generate constraint validations
-        questions.extend(generator.generate_constraint_questions(self.constraints))
-        
+        questions = self._generate_all()
         self.questions = questions
         return questions
     
     def get_priority_questions(self, priority: int = 1) -> List[SocraticQuestion]:
-        """Get questions by priority level"""
-        return [q for q in self.questions if q.priority <= priority]
+        """Get questions by priority level
+        
+        Before any questions are generated or assigned, they are generated
+        on demand without being stored.
+        """
+        questions = self.questions or self._generate_all()
+        return [q for q in questions if q.priority <= priority]
     
     def get_questions_by_type(self, question_type: QuestionType) -> List[SocraticQuestion]:
-        """Get questions by type"""
+        """Get questions by type
+        
+        Before any questions are generated or assigned, only the requested
+        type is generated, on demand and without being stored.
+        """
+        if not self.questions:
+            return self._ensure(question_type)
         return [q for q in self.questions if q.question_type == question_type]
     
     def to_dict(self) -> Dict[str, Any]:
@@ -229,7 +281,7 @@ class SocraticSession:
             'questions': [
                 {
                     'question': q.question,
-                    'type': q.question_type.value,
+                    'type': _QTYPE_VALUE[q.question_type],
                     'context': q.context,
                     'expected_outcome': q.expected_outcome,
                     'priority': q.priority
@@ -260,6 +312,15 @@ class SocraticSession:
             'insights': self.insights,
             'created_at': self.created_at.isoformat()
         }
+    
+    def to_json(self, pretty: bool = True) -> str:
+        """Convert session to JSON string (compact when pretty=False)"""
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
 
 
 def create_auth_socratic_session() -> SocraticSession:
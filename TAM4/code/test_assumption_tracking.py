@@ -2,9 +2,12 @@
 Tests for assumption tracking system
 """
 
+import copy
+import json
 import pytest
 from datetime import datetime, timedelta
 
+import assumption_tracking
 from assumption_tracking import (
     Evidence, ValidationTask, Assumption, AssumptionStatus, ValidationMethod,
     AssumptionRegistry, create_sample_registry
@@ -36,6 +39,9 @@ class TestEvidence:
         
         with pytest.raises(ValueError, match="Confidence must be 1-5"):
             Evidence("description", "source", True, 6)
+        
+        with pytest.raises(ValueError, match="Confidence must be 1-5"):
+            Evidence("description", "source", True, 2.5)
 
 
 class TestValidationTask:
@@ -115,7 +121,18 @@ class TestAssumption:
         
         # Should be conditional when evidence is mixed
         assert assumption.status == AssumptionStatus.CONDITIONAL
-    
+
+    def test_initial_evidence_counts_toward_status(self):
+        assumption = Assumption(
+            "test", "test desc", "context", "impact",
+            evidence=[Evidence("Contradict", "source", False, 5)]
+        )
+
+        assumption.add_evidence(Evidence("Support", "source", True, 4))
+
+        # 4 vs 5 is close enough to be conditional, not confirmed
+        assert assumption.status == AssumptionStatus.CONDITIONAL
+
     def test_add_validation_task(self):
         assumption = Assumption("test", "test desc", "context", "impact")
         task = ValidationTask("Validate this", ValidationMethod.USER_RESEARCH)
@@ -153,7 +170,33 @@ class TestAssumption:
         task1.completed = True
         
         assumption.validation_tasks = [task1, task2]
-        
+
+        assert assumption.get_validation_progress() == 0.5
+
+    def test_validation_progress_tracks_completion(self):
+        assumption = Assumption("test", "test desc", "context", "impact")
+        task1 = ValidationTask("Task 1", ValidationMethod.USER_RESEARCH)
+        task2 = ValidationTask("Task 2", ValidationMethod.DATA_ANALYSIS)
+        assumption.add_validation_task(task1)
+        assumption.add_validation_task(task2)
+        assert assumption.get_validation_progress() == 0.0
+
+        task1.mark_complete("Done")
+        assert assumption.get_validation_progress() == 0.5
+
+        # Completing a task twice does not count it twice
+        task1.mark_complete("Done again")
+        task2.mark_complete("Done")
+        assert assumption.get_validation_progress() == 1.0
+
+    def test_validation_progress_sees_direct_changes(self):
+        assumption = Assumption("test", "test desc", "context", "impact")
+        task1 = ValidationTask("Task 1", ValidationMethod.USER_RESEARCH)
+        assumption.add_validation_task(task1)
+        assert assumption.get_validation_progress() == 0.0
+
+        task1.completed = True
+        assumption.validation_tasks.append(ValidationTask("Task 2", ValidationMethod.DATA_ANALYSIS))
         assert assumption.get_validation_progress() == 0.5
 
 
@@ -222,7 +265,32 @@ class TestAssumptionRegistry:
         confirmed_list = registry.get_by_status(AssumptionStatus.CONFIRMED)
         assert len(confirmed_list) == 1
         assert confirmed_list[0] == confirmed
-    
+
+    def test_get_by_status_after_status_change(self):
+        registry = AssumptionRegistry("Test")
+        assumption = registry.create_assumption("test", "desc", "context", "impact")
+
+        assumption.add_evidence(Evidence("Contradict", "source", False, 5))
+
+        assert registry.get_by_status(AssumptionStatus.UNVALIDATED) == []
+        assert registry.get_by_status(AssumptionStatus.REFUTED) == [assumption]
+
+        registry.remove_assumption("test")
+        assert registry.get_by_status(AssumptionStatus.REFUTED) == []
+
+    def test_status_lookups_follow_copies_and_other_registries(self):
+        registry = AssumptionRegistry("Test")
+        assumption = registry.create_assumption("test", "desc", "context", "impact", priority=1)
+        other = AssumptionRegistry("Other")
+        other.add_assumption(assumption)
+
+        copy.copy(assumption).status = AssumptionStatus.REFUTED
+        assert registry.get_critical_unvalidated() == [assumption]
+
+        assumption.status = AssumptionStatus.CONFIRMED
+        assert registry.get_by_status(AssumptionStatus.CONFIRMED) == [assumption]
+        assert registry.get_critical_unvalidated() == []
+
     def test_get_by_priority(self):
         registry = AssumptionRegistry("Test")
         
@@ -308,6 +376,17 @@ class TestAssumptionRegistry:
         registry.add_dependency("child", "parent")
         
         assert "parent" in child.dependencies
+
+    def test_add_dependencies(self):
+        registry = AssumptionRegistry("Test")
+
+        registry.create_assumption("a", "A", "context", "impact")
+        registry.create_assumption("b", "B", "context", "impact")
+        child = registry.create_assumption("child", "Child", "context", "impact")
+
+        registry.add_dependencies("child", ["a", "b", "missing"])
+
+        assert child.dependencies == {"a", "b"}
     
     def test_get_dependency_chain(self):
         registry = AssumptionRegistry("Test")
@@ -322,7 +401,42 @@ class TestAssumptionRegistry:
         
         chain = registry.get_dependency_chain("c")
         assert chain == {"a", "b"}  # c depends on both a and b (transitively)
-    
+
+    def test_get_dependency_chain_with_cycle(self):
+        registry = AssumptionRegistry("Test")
+        for aid in ("a", "b", "c"):
+            registry.create_assumption(aid, aid.upper(), "context", "impact")
+
+        # Cycle: a -> b -> c -> a
+        registry.add_dependency("a", "b")
+        registry.add_dependency("b", "c")
+        registry.add_dependency("c", "a")
+
+        assert registry.get_dependency_chain("a") == {"a", "b", "c"}
+
+    def test_get_dependency_chain_sees_new_dependencies(self):
+        registry = AssumptionRegistry("Test")
+        for aid in ("a", "b", "c"):
+            registry.create_assumption(aid, aid.upper(), "context", "impact")
+        registry.add_dependency("c", "b")
+
+        chain = registry.get_dependency_chain("c")
+        assert chain == {"b"}
+        chain.add("mutated")  # Callers get their own copy
+
+        registry.add_dependency("b", "a")
+        assert registry.get_dependency_chain("c") == {"a", "b"}
+
+    def test_get_dependency_chain_sees_direct_dependency_edits(self):
+        registry = AssumptionRegistry("Test")
+        for aid in ("a", "b", "c"):
+            registry.create_assumption(aid, aid.upper(), "context", "impact")
+        registry.add_dependency("c", "b")
+        assert registry.get_dependency_chain("c") == {"b"}
+
+        registry.assumptions["b"].dependencies.add("a")
+        assert registry.get_dependency_chain("c") == {"a", "b"}
+
     def test_to_dict(self):
         registry = AssumptionRegistry("Test Project")
         assumption = registry.create_assumption("test", "Test assumption", "context", "impact")
@@ -345,6 +459,25 @@ class TestAssumptionRegistry:
         assert isinstance(json_str, str)
         assert "Test" in json_str
 
+    def test_to_json_compact(self):
+        registry = AssumptionRegistry("Test")
+        registry.create_assumption("test", "Test assumption", "context", "impact")
+
+        json_str = registry.to_json(pretty=False)
+
+        assert "\n" not in json_str
+        assert json.loads(json_str)['summary']['total_assumptions'] == 1
+
+    def test_to_json_same_without_orjson(self, monkeypatch):
+        registry = AssumptionRegistry("Café checkout")
+        registry.create_assumption("test", "Users pay in €", "context", "impact")
+        pretty, compact = registry.to_json(), registry.to_json(pretty=False)
+
+        monkeypatch.setattr(assumption_tracking, "orjson", None)
+        assert registry.to_json() == pretty
+        assert registry.to_json(pretty=False) == compact
+        assert "Users pay in €" in compact
+
 
 class TestCreateSampleRegistry:
     
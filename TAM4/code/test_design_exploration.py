@@ -2,6 +2,9 @@
 Tests for design exploration tools
 """
 
+import copy
+import pickle
+
 import pytest
 
 from design_exploration import (
@@ -111,6 +114,25 @@ class TestDesignAlternative:
         assert score.score == 4
         assert score.rationale == "Updated assessment"
     
+    def test_add_scores(self):
+        alt = DesignAlternative("test", "Test Alt", "desc", "approach")
+        alt.add_score(DesignDimension.SCALABILITY, 2, 5, "Initial")
+        assert alt.get_overall_score() == 2.0
+        
+        alt.add_scores([
+            (DesignDimension.SCALABILITY, 4, 5, "Revised"),
+            (DesignDimension.SECURITY, 3, 5, "Decent"),
+        ])
+        assert alt.get_score(DesignDimension.SCALABILITY).rationale == "Revised"
+        assert alt.get_overall_score() == 3.5
+        
+        with pytest.raises(ValueError, match="Score must be 1-5"):
+            alt.add_scores([
+                (DesignDimension.COST, 3, 5, "Fine"),
+                (DesignDimension.RELIABILITY, 6, 5, "Invalid"),
+            ])
+        assert DesignDimension.COST not in alt.scores
+    
     def test_get_overall_score_equal_weights(self):
         alt = DesignAlternative("test", "Test Alt", "desc", "approach")
         
@@ -141,6 +163,25 @@ class TestDesignAlternative:
         
         assert alt.get_overall_score() == 0.0
 
+    def test_get_overall_score_after_changes(self):
+        alt = DesignAlternative("test", "Test Alt", "desc", "approach")
+        alt.add_score(DesignDimension.SCALABILITY, 4, 5, "Good")
+        assert alt.get_overall_score() == 4.0
+
+        alt.add_score(DesignDimension.SCALABILITY, 2, 5, "Revised")
+        assert alt.get_overall_score() == 2.0
+
+        alt.add_score(DesignDimension.SECURITY, 5, 5, "Strong")
+        weights = {DesignDimension.SECURITY: 1.0}
+        assert alt.get_overall_score(weights) == 5.0
+        assert alt.get_overall_score() == 3.5
+
+        # In-place edits to the weights or the scores are seen too
+        weights[DesignDimension.SCALABILITY] = 1.0
+        assert alt.get_overall_score(weights) == 3.5
+        alt.scores[DesignDimension.SECURITY] = DesignScore(DesignDimension.SECURITY, 2, 5, "Weak")
+        assert alt.get_overall_score(weights) == 2.0
+
 
 class TestDesignExplorer:
     
@@ -223,6 +264,16 @@ class TestDesignExplorer:
         # alt1 should rank higher (score 5 vs 3)
         assert rankings[0][0] == "alt1"  # ID of top-ranked alternative
         assert rankings[0][1] > rankings[1][1]  # Higher score
+
+    def test_rank_alternatives_ties_keep_insertion_order(self):
+        explorer = DesignExplorer("Test problem")
+        for alt_id in ("alt1", "alt2", "alt3"):
+            alt = explorer.create_alternative(alt_id, alt_id, "desc", "approach")
+            alt.add_score(DesignDimension.SCALABILITY, 3, 5, "Good")
+
+        rankings = explorer.rank_alternatives()
+
+        assert [alt_id for alt_id, _, _ in rankings] == ["alt1", "alt2", "alt3"]
     
     def test_compare_alternatives(self):
         explorer = DesignExplorer("Test problem")
@@ -247,6 +298,20 @@ class TestDesignExplorer:
         security = comparison['dimension_comparison']['security']
         assert security['winner'] == 'alt2'  # alt2 wins security (5 > 3)
     
+    def test_compare_dimension_scored_by_one_alternative(self):
+        explorer = DesignExplorer("Test problem")
+        alt1 = explorer.create_alternative("alt1", "Alt 1", "desc", "approach")
+        explorer.create_alternative("alt2", "Alt 2", "desc", "approach")
+        alt1.add_score(DesignDimension.COST, 4, 3, "Cheap")
+
+        comparison = explorer.compare_alternatives("alt1", "alt2")
+
+        assert comparison['dimension_comparison']['cost'] == {
+            'alt1_score': 4, 'alt1_confidence': 3, 'alt1_rationale': "Cheap",
+            'alt2_score': None, 'alt2_confidence': None, 'alt2_rationale': None,
+            'winner': None
+        }
+
     def test_compare_nonexistent_alternatives(self):
         explorer = DesignExplorer("Test problem")
         
@@ -272,7 +337,48 @@ class TestDesignExplorer:
         assert len(suggestions) > 0
         suggestion_text = " ".join(suggestions).lower()
         assert "scalability" in suggestion_text
-    
+
+    def test_suggest_improvements_after_replacing_pattern(self):
+        explorer = DesignExplorer("Test problem")
+        explorer.add_pattern(DesignPattern(
+            "Pattern", "desc", "when", "when not", {},
+            typical_scores={DesignDimension.SCALABILITY: 5}
+        ))
+        explorer.add_pattern(DesignPattern(
+            "Pattern", "desc", "when", "when not", {},
+            typical_scores={DesignDimension.SCALABILITY: 2}
+        ))
+
+        alt = explorer.create_alternative("alt1", "Alt 1", "desc", "approach")
+        alt.add_score(DesignDimension.SCALABILITY, 2, 4, "Poor scalability")
+
+        assert explorer.suggest_improvements("alt1") == [
+            "Low score in scalability: Poor scalability"
+        ]
+
+    def test_suggest_improvements_after_editing_patterns_directly(self):
+        explorer = DesignExplorer("Test problem")
+        pattern = DesignPattern(
+            "Pattern", "desc", "when", "when not", {},
+            typical_scores={DesignDimension.SCALABILITY: 2}
+        )
+        explorer.add_pattern(pattern)
+        alt = explorer.create_alternative("alt1", "Alt 1", "desc", "approach")
+        alt.add_score(DesignDimension.SCALABILITY, 2, 4, "Poor scalability")
+
+        pattern.typical_scores[DesignDimension.SCALABILITY] = 5
+        assert explorer.suggest_improvements("alt1") == [
+            "To improve scalability: Consider patterns like Pattern"
+        ]
+
+        explorer.patterns["Pattern"] = DesignPattern(
+            "Pattern", "desc", "when", "when not", {},
+            typical_scores={DesignDimension.SCALABILITY: 1}
+        )
+        assert explorer.suggest_improvements("alt1") == [
+            "Low score in scalability: Poor scalability"
+        ]
+
     def test_generate_hybrid_alternative(self):
         explorer = DesignExplorer("Test problem")
         
@@ -305,6 +411,19 @@ class TestDesignExplorer:
         assert len(hybrid.risks) == 2
         assert len(hybrid.assumptions) == 2
     
+    def test_generate_hybrid_ties_keep_first_source(self):
+        explorer = DesignExplorer("Test problem")
+        alt1 = explorer.create_alternative("alt1", "Alt 1", "desc", "approach")
+        alt1.add_score(DesignDimension.COST, 4, 3, "Cheap")
+        alt2 = explorer.create_alternative("alt2", "Alt 2", "desc", "approach")
+        alt2.add_score(DesignDimension.COST, 4, 5, "Also cheap")
+        alt2.add_score(DesignDimension.SECURITY, 3, 3, "Decent")
+
+        hybrid = explorer.generate_hybrid_alternative(["alt1", "alt2"], "Hybrid")
+
+        assert hybrid.get_score(DesignDimension.COST).rationale == "From Alt 1: Cheap"
+        assert hybrid.get_score(DesignDimension.SECURITY).rationale == "From Alt 2: Decent"
+
     def test_generate_hybrid_insufficient_alternatives(self):
         explorer = DesignExplorer("Test problem")
         
@@ -348,6 +467,14 @@ class TestGetCommonPatterns:
             for score in pattern.typical_scores.values():
                 assert 1 <= score <= 5
 
+    def test_common_patterns_are_independent_copies(self):
+        patterns = get_common_patterns()
+        patterns[0].typical_scores[DesignDimension.SECURITY] = 5
+
+        assert DesignDimension.SECURITY not in get_common_patterns()[0].typical_scores
+        assert pickle.loads(pickle.dumps(patterns))[0].name == patterns[0].name
+        assert copy.deepcopy(create_sample_explorer()).patterns.keys() == create_sample_explorer().patterns.keys()
+
 
 class TestCreateSampleExplorer:
     
@@ -5,8 +5,9 @@ Tests for domain modeling framework
 import pytest
 from datetime import datetime
 
+import domain_modeling
 from domain_modeling import (
-    DomainInvariant, EdgeCase, EntityLifecycle, EntityLifecycleState,
+    DomainInvariant, EdgeCase, EntityLifecycle, EntityLifecycleState, Impact,
     DomainModel, DomainModelBuilder, create_authentication_model
 )
 
@@ -61,6 +62,25 @@ class TestEdgeCase:
         # Should default to medium = 3, so 3 * 3 = 9
         assert case.risk_score() == 9
 
+    def test_impact_enum(self):
+        case = EdgeCase(scenario="Outage", impact=Impact.HIGH, likelihood=3)
+
+        assert case.impact == "high"
+        assert case.risk_score() == 12
+
+    def test_non_string_impact_defaults_to_medium(self):
+        case = EdgeCase(scenario="Outage", impact=None, likelihood=3)
+
+        assert case.impact is None
+        assert case.risk_score() == 9
+
+    def test_risk_score_after_impact_change(self):
+        case = EdgeCase(scenario="Outage", impact="Low", likelihood=2)
+        assert case.risk_score() == 4
+
+        case.impact = "CRITICAL"
+        assert case.risk_score() == 10
+
 
 class TestEntityLifecycle:
     
@@ -70,12 +90,27 @@ class TestEntityLifecycle:
         assert EntityLifecycleState.CREATED in entity.states
         assert EntityLifecycleState.ACTIVE in entity.states
     
+    def test_states_are_frozen(self):
+        entity = EntityLifecycle("Order", states={EntityLifecycleState.CREATED})
+
+        assert entity.states == frozenset({EntityLifecycleState.CREATED})
+        assert EntityLifecycle("User").states is EntityLifecycle("Team").states
+
     def test_add_transition(self):
         entity = EntityLifecycle("Order")
         entity.add_transition(EntityLifecycleState.CREATED, EntityLifecycleState.ACTIVE)
         
         assert entity.can_transition(EntityLifecycleState.CREATED, EntityLifecycleState.ACTIVE)
         assert not entity.can_transition(EntityLifecycleState.ACTIVE, EntityLifecycleState.CREATED)
+
+    def test_multiple_transitions_from_same_state(self):
+        entity = EntityLifecycle("Order")
+        entity.add_transition(EntityLifecycleState.ACTIVE, EntityLifecycleState.SUSPENDED)
+        entity.add_transition(EntityLifecycleState.ACTIVE, EntityLifecycleState.ARCHIVED)
+
+        assert entity.can_transition(EntityLifecycleState.ACTIVE, EntityLifecycleState.SUSPENDED)
+        assert entity.can_transition(EntityLifecycleState.ACTIVE, EntityLifecycleState.ARCHIVED)
+        assert not entity.can_transition(EntityLifecycleState.ACTIVE, EntityLifecycleState.DELETED)
     
     def test_empty_entity_name(self):
         with pytest.raises(ValueError, match="Entity name cannot be empty"):
@@ -136,6 +171,25 @@ class TestDomainModel:
         assert len(critical_list) == 1
         assert critical_list[0] == critical
     
+    def test_critical_invariants_track_later_changes(self):
+        model = DomainModel("Test", "Test")
+        first = DomainInvariant("first", "desc", "rule", priority=1)
+        second = DomainInvariant("second", "desc", "rule", priority=1)
+        
+        model.add_invariant(first)
+        assert model.get_critical_invariants() == [first]
+        
+        model.add_invariant(second)
+        assert model.get_critical_invariants() == [first, second]
+        
+        model.invariants = [second]
+        assert model.get_critical_invariants() == [second]
+        
+        # Edits made directly to the list are seen too
+        model.invariants.remove(second)
+        model.add_invariant(DomainInvariant("minor", "desc", "rule", priority=2))
+        assert model.get_critical_invariants() == []
+    
     def test_get_high_risk_cases(self):
         model = DomainModel("Test", "Test")
         high_risk = EdgeCase("high risk", "critical", 5)  # 5 * 5 = 25
@@ -157,6 +211,30 @@ class TestDomainModel:
         assert dict_repr['description'] == "Test description"
         assert len(dict_repr['assumptions']) == 1
         assert 'created_at' in dict_repr
+
+    def test_to_dict_reflects_later_additions(self):
+        model = DomainModel("Test System", "Test description")
+        assert model.to_dict()['assumptions'] == []
+
+        model.add_assumption("Test assumption")
+        model.add_edge_case(EdgeCase("scenario", "high", 2))
+        dict_repr = model.to_dict()
+        assert dict_repr['assumptions'] == ["Test assumption"]
+        assert dict_repr['edge_cases'][0]['risk_score'] == 8
+
+        model.name = "Renamed"
+        assert model.to_dict()['name'] == "Renamed"
+
+    def test_to_dict_is_not_shared(self):
+        model = DomainModel("Test System", "Test description")
+        case = EdgeCase("scenario", "high", 2)
+        model.add_edge_case(case)
+
+        model.to_dict()['name'] = "hacked"
+        case.likelihood = 5
+        dict_repr = model.to_dict()
+        assert dict_repr['name'] == "Test System"
+        assert dict_repr['edge_cases'][0]['risk_score'] == 20
     
     def test_to_json(self):
         model = DomainModel("Test", "Test")
@@ -165,6 +243,21 @@ class TestDomainModel:
         assert isinstance(json_str, str)
         assert "Test" in json_str
 
+    def test_to_json_reflects_changes(self):
+        model = DomainModel("Test", "Test")
+        assert "Users have email" not in model.to_json()
+        
+        model.add_assumption("Users have email")
+        assert "Users have email" in model.to_json()
+
+    def test_to_json_same_without_orjson(self, monkeypatch):
+        model = DomainModel("Café", "Orders in €")
+        expected = model.to_json()
+
+        monkeypatch.setattr(domain_modeling, "orjson", None)
+        assert model.to_json() == expected
+        assert "Orders in €" in expected
+
 
 class TestDomainModelBuilder:
     
@@ -223,6 +316,12 @@ class TestDomainModelBuilder:
         
         assert final_builder == builder  # Should return to original builder
 
+    def test_builder_exposes_model_in_progress(self):
+        builder = DomainModelBuilder("Test", "Test").with_assumption("Test assumption")
+
+        assert builder.model.assumptions == ["Test assumption"]
+        assert builder.build() is builder.model
+
 
 class TestCreateAuthenticationModel:
     
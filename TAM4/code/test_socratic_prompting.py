@@ -2,15 +2,30 @@
 Tests for Socratic prompting system
 """
 
+import json
 import pytest
 from datetime import datetime
 
+import socratic_prompting
 from socratic_prompting import (
     SocraticQuestion, QuestionType, DesignAlternative, AssumptionChallenge,
     SocraticPromptGenerator, SocraticSession, create_auth_socratic_session
 )
 
 
+def _corpus(texts):
+    """Lowercased texts joined into one string for substring checks"""
+    return "\n".join(texts).lower()
+
+
+class TestQuestionType:
+
+    def test_question_type_is_str(self):
+        assert QuestionType.SIMPLIFICATION == "simplification"
+        assert QuestionType("edge_case_discovery") is QuestionType.EDGE_CASE_DISCOVERY
+        assert json.dumps(QuestionType.CONTEXT_EXPANSION) == '"context_expansion"'
+
+
 class TestSocraticQuestion:
     
     def test_create_question(self):
@@ -97,52 +112,95 @@ class TestAssumptionChallenge:
         assert not challenge.is_well_supported()
 
 
+@pytest.fixture(scope="module")
+def generator():
+    """One shared generator; its generate_* methods keep no state"""
+    return SocraticPromptGenerator()
+
+
 class TestSocraticPromptGenerator:
     
-    def test_generate_assumption_questions(self):
-        generator = SocraticPromptGenerator()
-        assumptions = ["Users want notifications", "Email is reliable"]
-        
-        questions = generator.generate_assumption_questions(assumptions)
-        
-        assert len(questions) > 0
-        assert all(q.question_type == QuestionType.ASSUMPTION_CHALLENGE for q in questions)
-        
-        # Should generate questions for both assumptions
-        question_texts = [q.question for q in questions]
-        assert any("notifications" in q.lower() for q in question_texts)
-        assert any("email" in q.lower() for q in question_texts)
-    
-    def test_generate_alternative_questions(self):
-        generator = SocraticPromptGenerator()
-        problem = "Design authentication system"
-        
-        questions = generator.generate_alternative_questions(problem)
+    @pytest.mark.parametrize("method, arg, question_type, needles", [
+        ("generate_assumption_questions", ["Users want notifications", "Email is reliable"],
+         QuestionType.ASSUMPTION_CHALLENGE, ("notifications", "email")),
+        ("generate_alternative_questions", "Design authentication system",
+         QuestionType.ALTERNATIVE_EXPLORATION, ("authentication",)),
+        ("generate_edge_case_questions", "User management system",
+         QuestionType.EDGE_CASE_DISCOVERY, ()),
+        ("generate_constraint_questions", ["Must support 10k users", "Response time < 200ms"],
+         QuestionType.CONSTRAINT_VALIDATION, ()),
+    ])
+    def test_generate_questions(self, generator, method, arg, question_type, needles):
+        questions = getattr(generator, method)(arg)
         
         assert len(questions) > 0
-        assert all(q.question_type == QuestionType.ALTERNATIVE_EXPLORATION for q in questions)
-        
-        # Questions should reference the problem
-        question_texts = [q.question for q in questions]
-        assert any("authentication" in q.lower() for q in question_texts)
-    
-    def test_generate_edge_case_questions(self):
-        generator = SocraticPromptGenerator()
-        problem = "User management system"
+        assert all(q.question_type == question_type for q in questions)
         
-        questions = generator.generate_edge_case_questions(problem)
-        
-        assert len(questions) > 0
-        assert all(q.question_type == QuestionType.EDGE_CASE_DISCOVERY for q in questions)
-    
-    def test_generate_constraint_questions(self):
-        generator = SocraticPromptGenerator()
+        # Questions should reference every input
+        corpus = _corpus(q.question for q in questions)
+        for needle in needles:
+            assert needle in corpus
+
+    def test_questions_match_templates(self, generator):
         constraints = ["Must support 10k users", "Response time < 200ms"]
-        
+
         questions = generator.generate_constraint_questions(constraints)
-        
-        assert len(questions) > 0
-        assert all(q.question_type == QuestionType.CONSTRAINT_VALIDATION for q in questions)
+
+        expected = [
+            template.format(constraint=constraint, constraints=", ".join(constraints))
+            for constraint in constraints
+            for template in SocraticPromptGenerator.CONSTRAINT_TEMPLATES
+        ]
+        assert [q.question for q in questions] == expected
+
+    def test_generated_questions_are_complete(self, generator):
+        question = generator.generate_alternative_questions("Design authentication system")[0]
+
+        assert question == SocraticQuestion(
+            question=question.question,
+            question_type=QuestionType.ALTERNATIVE_EXPLORATION,
+            context="Exploring alternatives for: Design authentication system",
+            expected_outcome="Multiple different solution approaches with trade-offs",
+            priority=1
+        )
+
+    def test_generated_questions_share_context(self, generator):
+        questions = generator.generate_assumption_questions(["Email is reliable", "Users read email"])
+
+        assert [q.question for q in questions] == [
+            template.format(assumption=assumption)
+            for assumption in ("Email is reliable", "Users read email")
+            for template in SocraticPromptGenerator.ASSUMPTION_TEMPLATES
+        ]
+        templates_per_assumption = len(SocraticPromptGenerator.ASSUMPTION_TEMPLATES)
+        assert [q.context for q in questions] == (
+            ["Challenging assumption: Email is reliable"] * templates_per_assumption
+            + ["Challenging assumption: Users read email"] * templates_per_assumption
+        )
+        assert {q.expected_outcome for q in questions} == {
+            "Evidence for/against the assumption, alternative perspectives"
+        }
+
+    def test_generate_without_instance(self):
+        questions = SocraticPromptGenerator.generate_edge_case_questions("User management system")
+
+        assert len(questions) == len(SocraticPromptGenerator.EDGE_CASE_TEMPLATES)
+
+    def test_subclass_templates(self):
+        class CustomGenerator(SocraticPromptGenerator):
+            ASSUMPTION_TEMPLATES = ["Is '{assumption}' really true?"]
+
+        questions = CustomGenerator().generate_assumption_questions(["Email is reliable"])
+
+        assert [q.question for q in questions] == ["Is 'Email is reliable' really true?"]
+
+    def test_templates_use_str_format_rules(self):
+        class CustomGenerator(SocraticPromptGenerator):
+            ASSUMPTION_TEMPLATES = ["{assumption[0]} / {json}"]
+
+        # Unknown names are not looked up in module globals
+        with pytest.raises(KeyError):
+            CustomGenerator.generate_assumption_questions(["Email is reliable"])
 
 
 class TestSocraticSession:
@@ -154,6 +212,14 @@ class TestSocraticSession:
         assert len(session.assumptions) == 0
         assert len(session.constraints) == 0
         assert len(session.questions) == 0
+
+    def test_created_at(self):
+        before = datetime.now()
+        session = SocraticSession("Design notification system")
+
+        assert isinstance(session.created_at, datetime)
+        assert abs((session.created_at - before).total_seconds()) < 1
+        assert session.created_at == session.created_at
     
     def test_add_assumption(self):
         session = SocraticSession("Test problem")
@@ -163,6 +229,23 @@ class TestSocraticSession:
         assert len(session.assumptions) == 1  # Should not add duplicates
         assert "Users like notifications" in session.assumptions
     
+    def test_add_assumption_after_direct_assignment(self):
+        session = SocraticSession("Test problem", assumptions=["Users like notifications"])
+        session.add_assumption("  Users like notifications ")
+        assert session.assumptions == ["Users like notifications"]
+
+        session.assumptions = ["Email is reliable"]
+        session.add_assumption("Users like notifications")
+        session.add_assumption("Email is reliable")
+        assert session.assumptions == ["Email is reliable", "Users like notifications"]
+
+        # Edits made directly to the list are seen too
+        session.assumptions.remove("Email is reliable")
+        session.assumptions.append("Sessions expire")
+        session.add_assumption("Sessions expire")
+        session.add_assumption("Email is reliable")
+        assert session.assumptions == ["Users like notifications", "Sessions expire", "Email is reliable"]
+
     def test_add_constraint(self):
         session = SocraticSession("Test problem")
         session.add_constraint("Must be fast")
@@ -246,6 +329,63 @@ class TestSocraticSession:
         assert len(assumption_questions) == 2
         assert all(q.question_type == QuestionType.ASSUMPTION_CHALLENGE for q in assumption_questions)
     
+    def test_question_lookups_follow_question_changes(self):
+        session = SocraticSession("Test problem")
+        session.questions = [
+            SocraticQuestion("Q1", QuestionType.ASSUMPTION_CHALLENGE, "C1", "O1", priority=2),
+            SocraticQuestion("Q2", QuestionType.SIMPLIFICATION, "C2", "O2", priority=1)
+        ]
+        assert len(session.get_priority_questions(priority=1)) == 1
+        assert len(session.get_questions_by_type(QuestionType.SIMPLIFICATION)) == 1
+
+        session.questions.append(
+            SocraticQuestion("Q3", QuestionType.SIMPLIFICATION, "C3", "O3", priority=1)
+        )
+        assert [q.question for q in session.get_priority_questions(priority=1)] == ["Q2", "Q3"]
+        assert len(session.get_questions_by_type(QuestionType.SIMPLIFICATION)) == 2
+
+        session.questions = session.questions[:1]
+        assert session.get_priority_questions(priority=1) == []
+        assert session.get_questions_by_type(QuestionType.SIMPLIFICATION) == []
+
+        session.questions[0] = SocraticQuestion("Q4", QuestionType.SIMPLIFICATION, "C4", "O4", priority=1)
+        assert len(session.get_priority_questions(priority=1)) == 1
+        assert len(session.get_questions_by_type(QuestionType.ASSUMPTION_CHALLENGE)) == 0
+
+    def test_get_questions_by_type_before_generation(self):
+        session = SocraticSession("Design auth system")
+        session.add_assumption("Passwords are secure")
+
+        questions = session.get_questions_by_type(QuestionType.ASSUMPTION_CHALLENGE)
+        assert len(questions) == len(SocraticPromptGenerator.ASSUMPTION_TEMPLATES)
+        assert len(session.questions) == 0  # Nothing stored until generate_questions
+
+        session.add_assumption("Email is reliable")
+        questions = session.get_questions_by_type(QuestionType.ASSUMPTION_CHALLENGE)
+        assert len(questions) == 2 * len(SocraticPromptGenerator.ASSUMPTION_TEMPLATES)
+        assert session.get_questions_by_type(QuestionType.SIMPLIFICATION) == []
+
+    def test_get_priority_questions_before_generation(self):
+        session = SocraticSession("Design auth system")
+        session.add_assumption("Passwords are secure")
+
+        priority_questions = session.get_priority_questions(priority=1)
+        assumption_questions = session.get_questions_by_type(QuestionType.ASSUMPTION_CHALLENGE)
+        assert [q for q in priority_questions if q.question_type == QuestionType.ASSUMPTION_CHALLENGE] == assumption_questions
+        assert len(session.questions) == 0
+
+    def test_regenerated_questions_are_independent(self):
+        session = SocraticSession("Design auth system")
+        session.add_assumption("Passwords are secure")
+        first = session.generate_questions()
+        first[0].priority = 3
+
+        second = session.generate_questions()
+        assert second[0].priority == 1
+        assert second[0] is not first[0]
+        assert [q.question for q in second] == [q.question for q in first]
+        assert session.get_questions_by_type(QuestionType.ASSUMPTION_CHALLENGE)[0] is second[0]
+
     def test_to_dict(self):
         session = SocraticSession("Test problem")
         session.add_assumption("Test assumption")
@@ -258,34 +398,88 @@ class TestSocraticSession:
         assert len(dict_repr['insights']) == 1
         assert 'created_at' in dict_repr
 
+    def test_to_json(self):
+        session = SocraticSession("Test problem")
+        session.add_assumption("Test assumption")
+        session.generate_questions()
+
+        assert json.loads(session.to_json()) == session.to_dict()
+        assert json.loads(session.to_json(pretty=False)) == session.to_dict()
+        assert "\n" not in session.to_json(pretty=False)
+
+    def test_to_json_same_without_orjson(self, monkeypatch):
+        session = SocraticSession("Café ordering")
+        session.add_assumption("Prices are in €")
+        session.generate_questions()
+        pretty, compact = session.to_json(), session.to_json(pretty=False)
+
+        monkeypatch.setattr(socratic_prompting, "orjson", None)
+        assert session.to_json() == pretty
+        assert session.to_json(pretty=False) == compact
+        assert "Prices are in €" in compact
+
+    def test_to_dict_after_regenerating_questions(self):
+        session = SocraticSession("Test problem")
+        session.generate_questions()
+        first = session.to_dict()['questions']
+
+        session.add_assumption("Test assumption")
+        session.generate_questions()
+        second = session.to_dict()['questions']
+
+        assert len(second) == len(first) + len(SocraticPromptGenerator.ASSUMPTION_TEMPLATES)
+        assert second[0]['type'] == QuestionType.ASSUMPTION_CHALLENGE.value
+
+    def test_to_dict_after_replacing_a_question(self):
+        session = SocraticSession("Test problem")
+        session.generate_questions()
+        session.to_dict()
+
+        session.questions[0] = SocraticQuestion("Q1", QuestionType.SIMPLIFICATION, "C1", "O1")
+        assert session.to_dict()['questions'][0]['question'] == "Q1"
+
+
+@pytest.fixture(scope="module")
+def auth_session():
+    """One shared auth session for the tests that only read it"""
+    return create_auth_socratic_session()
+
 
 class TestCreateAuthSocraticSession:
     
-    def test_create_auth_session(self):
-        session = create_auth_socratic_session()
-        
-        assert "authentication" in session.problem_statement.lower()
-        assert len(session.assumptions) >= 3  # Should have several assumptions
-        assert len(session.constraints) >= 3  # Should have constraints
-        assert len(session.questions) > 0     # Should generate questions
-        assert len(session.alternatives) >= 2 # Should have example alternatives
+    def test_create_auth_session(self, auth_session):
+        assert "authentication" in auth_session.problem_statement.lower()
+        assert len(auth_session.assumptions) >= 3  # Should have several assumptions
+        assert len(auth_session.constraints) >= 3  # Should have constraints
+        assert len(auth_session.questions) > 0     # Should generate questions
+        assert len(auth_session.alternatives) >= 2 # Should have example alternatives
     
-    def test_auth_session_assumptions(self):
-        session = create_auth_socratic_session()
-        
-        assumption_texts = [a.lower() for a in session.assumptions]
+    def test_auth_session_assumptions(self, auth_session):
+        keywords = ("password", "email")
+        hits = {
+            keyword for assumption in auth_session.assumptions
+            for keyword in keywords if keyword in assumption.lower()
+        }
         # Should challenge common auth assumptions
-        assert any("password" in assumption for assumption in assumption_texts)
-        assert any("email" in assumption for assumption in assumption_texts)
-    
-    def test_auth_session_alternatives(self):
+        assert hits == set(keywords)
+
+    def test_auth_session_rejects_duplicate_inputs(self):
         session = create_auth_socratic_session()
-        
-        assert len(session.alternatives) >= 2
-        alt_names = [alt.name for alt in session.alternatives]
+        assumption_count = len(session.assumptions)
+        constraint_count = len(session.constraints)
+
+        session.add_assumption(" Users will use strong passwords ")
+        session.add_constraint("Must comply with GDPR")
+
+        assert len(session.assumptions) == assumption_count
+        assert len(session.constraints) == constraint_count
+    
+    def test_auth_session_alternatives(self, auth_session):
+        assert len(auth_session.alternatives) >= 2
+        alt_names = [alt.name for alt in auth_session.alternatives]
         
         # Should have diverse alternatives
         assert len(set(alt_names)) == len(alt_names)  # No duplicates
         
         # Should have complexity scores
-        assert all(1 <= alt.complexity_score <= 5 for alt in session.alternatives)
\ No newline at end of file
+        assert all(1 <= alt.complexity_score <= 5 for alt in auth_session.alternatives)
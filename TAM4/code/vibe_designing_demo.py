@@ -9,9 +9,11 @@ This demo walks through the complete vibe designing process:
 4. Assumption tracking and validation
 
 Usage: python vibe_designing_demo.py
+       VIBE_DEMO_INTERACTIVE=0 python vibe_designing_demo.py  # no pauses between steps
 """
 
 import json
+import os
 from typing import Dict, Any
 
 from domain_modeling import (
@@ -28,6 +30,16 @@ from design_exploration import (
 )
 
 
+# Set VIBE_DEMO_INTERACTIVE=0 to run straight through, e.g. for scripted or timed runs
+_INTERACTIVE = os.environ.get("VIBE_DEMO_INTERACTIVE", "1") == "1"
+
+
+def pause(prompt: str):
+    """Wait for Enter between steps when running interactively"""
+    if _INTERACTIVE:
+        input(prompt)
+
+
 def print_header(title: str):
     """Print a formatted section header"""
     print("\n" + "="*60)
@@ -127,7 +139,7 @@ def demo_domain_modeling():
         if case.mitigation:
             print(f"    → Mitigation: {case.mitigation}")
     
-    input("\nPress Enter to continue to Socratic questioning...")
+    pause("\nPress Enter to continue to Socratic questioning...")
     return model
 
 
@@ -202,7 +214,7 @@ def demo_socratic_questioning(domain_model: DomainModel):
         print(f"     Complexity: {alt.complexity_score}/5, Risk: {alt.risk_level}")
         print(f"     Discovered via: {alt.discovered_via}")
     
-    input("\nPress Enter to continue to design exploration...")
+    pause("\nPress Enter to continue to design exploration...")
     return session
 
 
@@ -311,7 +323,7 @@ def demo_design_exploration(session: SocraticSession):
             for suggestion in suggestions:
                 print(f"    • {suggestion}")
     
-    input("\nPress Enter to continue to assumption tracking...")
+    pause("\nPress Enter to continue to assumption tracking...")
     return explorer
 
 
@@ -326,6 +338,8 @@ def demo_assumption_tracking(domain_model: DomainModel, session: SocraticSession
     
     # Add assumptions from domain model and session
     all_assumptions = set(domain_model.assumptions + session.assumptions)
+    # One searchable string; descriptions have no newlines, so matches can't span assumptions
+    assumption_text = "\n".join(all_assumptions)
     
     assumption_map = {
         "user_engagement": "Users will engage with notifications if relevant",
@@ -335,7 +349,7 @@ def demo_assumption_tracking(domain_model: DomainModel, session: SocraticSession
     }
     
     for key, description in assumption_map.items():
-        if any(description in assumption for assumption in all_assumptions):
+        if description in assumption_text:
             registry.create_assumption(
                 key,
                 description,
@@ -416,7 +430,7 @@ def demo_assumption_tracking(domain_model: DomainModel, session: SocraticSession
             print(f"  • {assumption.description}")
             print(f"    Impact if wrong: {assumption.impact_if_wrong}")
     
-    input("\nPress Enter to see the complete workflow summary...")
+    pause("\nPress Enter to see the complete workflow summary...")
     return registry
 
 
@@ -442,7 +456,7 @@ This approach transforms AI from a "code vending machine" into a
 "Socratic partner" for better design thinking.
     """)
     
-    input("Press Enter to start the demo...")
+    pause("Press Enter to start the demo...")
     
     # Step 1: Domain modeling
     domain_model = demo_domain_modeling()
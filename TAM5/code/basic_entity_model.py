@@ -3,14 +3,14 @@ from typing import List
 from uuid import UUID, uuid4
 
 # A Value Object: defined by its attributes, interchangeable.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Plank:
     material: str
     length_cm: int
     width_cm: int
 
 # An Entity: defined by a persistent, unique identifier.
-@dataclass
+@dataclass(slots=True)
 class Ship:
     ship_id: UUID
     name: str
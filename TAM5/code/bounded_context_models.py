@@ -1,10 +1,11 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List
 
 try:
-    from .event_sourced_model import ShipAggregate, PlankReplaced
+    from .event_sourced_model import ShipAggregate
 except ImportError:
-    from event_sourced_model import ShipAggregate, PlankReplaced
+    from event_sourced_model import ShipAggregate
 
 # In Maintenance Context: Ship is an Entity with full history
 class MaintenanceShip:
@@ -12,13 +13,16 @@ class MaintenanceShip:
         self.ship_id = aggregate.ship_id
         self.name = aggregate.name
         self.hull = aggregate.hull
-        self.repair_history = [
-            e for e in aggregate._changes 
-            if isinstance(e, PlankReplaced)
-        ]
+        # Remember how many repairs existed so the history stays a point-in-time view
+        self._aggregate = aggregate
+        self._repair_count = len(aggregate._repairs)
+    
+    @cached_property
+    def repair_history(self) -> List:
+        return self._aggregate._repairs[:self._repair_count]
         
     def needs_inspection(self) -> bool:
-        return len(self.repair_history) > 0
+        return self._repair_count > 0
 
 # In Fleet Planning Context: Ship becomes a Value Object
 @dataclass(frozen=True)
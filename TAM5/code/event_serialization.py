@@ -1,51 +1,243 @@
-from dataclasses import asdict
 import json
+import os
+import time
+import weakref
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union, BinaryIO
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from .event_sourced_model import Event, ShipLaunched, PlankReplaced, Plank, ShipAggregate
 except ImportError:
     from event_sourced_model import Event, ShipLaunched, PlankReplaced, Plank, ShipAggregate
 
+# Every event in a ship's log carries the same id, so parse each id string once
+@lru_cache(maxsize=1024)
+def _ship_id(value: str) -> UUID:
+    return UUID(value)
+
+# Planks are immutable values, so equal planks read back from storage can share one object
+@lru_cache(maxsize=4096)
+def _plank(material: str, length_cm: int, width_cm: int) -> Plank:
+    return Plank(material, length_cm, width_cm)
+
+def _plank_from_dict(data: Dict[str, Any]) -> Plank:
+    return _plank(data["material"], data["length_cm"], data["width_cm"])
+
+def _plank_to_dict(plank: Plank) -> Dict[str, Any]:
+    return {"material": plank.material, "length_cm": plank.length_cm, "width_cm": plank.width_cm}
+
+def _serialize_ship_launched(event: ShipLaunched) -> Dict[str, Any]:
+    return {
+        "ship_id": str(event.ship_id),
+        "name": event.name,
+        "initial_hull": [_plank_to_dict(p) for p in event.initial_hull],
+        "occurred_at": event.occurred_at.isoformat(),
+        "event_type": "ShipLaunched",
+    }
+
+def _serialize_plank_replaced(event: PlankReplaced) -> Dict[str, Any]:
+    return {
+        "ship_id": str(event.ship_id),
+        "plank_index": event.plank_index,
+        "new_plank": _plank_to_dict(event.new_plank),
+        "occurred_at": event.occurred_at.isoformat(),
+        "event_type": "PlankReplaced",
+    }
+
+# Fields are read directly rather than through dataclasses.asdict, which deep-copies every Plank
+_SERIALIZERS = {
+    ShipLaunched: _serialize_ship_launched,
+    PlankReplaced: _serialize_plank_replaced,
+}
+
 def serialize_event(event: Event) -> Dict[str, Any]:
     """Convert event to JSON-serializable dictionary."""
-    data = asdict(event)
-    data["event_type"] = event.__class__.__name__
-    data["occurred_at"] = data["occurred_at"].isoformat()
-    # Convert UUID to string for JSON serialization
-    if "ship_id" in data:
-        data["ship_id"] = str(data["ship_id"])
-    return data
+    serializer = _SERIALIZERS.get(type(event))
+    if serializer is None:
+        raise ValueError(f"Unknown event type: {event.__class__.__name__}")
+    return serializer(event)
+
+def _deserialize_ship_launched(data: Dict[str, Any], occurred_at: Optional[datetime]) -> ShipLaunched:
+    return ShipLaunched(
+        _ship_id(data["ship_id"]),
+        data["name"],
+        [_plank_from_dict(p) for p in data["initial_hull"]],
+        occurred_at,
+    )
+
+def _deserialize_plank_replaced(data: Dict[str, Any], occurred_at: Optional[datetime]) -> PlankReplaced:
+    return PlankReplaced(
+        _ship_id(data["ship_id"]),
+        data["plank_index"],
+        _plank_from_dict(data["new_plank"]),
+        occurred_at,
+    )
+
+_DESERIALIZERS = {
+    "ShipLaunched": _deserialize_ship_launched,
+    "PlankReplaced": _deserialize_plank_replaced,
+}
 
 def deserialize_event(data: Dict[str, Any]) -> Event:
     """Reconstruct event from stored dictionary."""
-    from uuid import UUID
+    return _deserializer(data)(data, datetime.fromisoformat(data["occurred_at"]))
+
+def _replay_event(data: Dict[str, Any]) -> Event:
+    # Only for events the loader feeds straight into a replay, which never reads
+    # occurred_at, so the timestamp is left unparsed (None) and never escapes
+    return _deserializer(data)(data, None)
+
+def _deserializer(data: Dict[str, Any]) -> Callable[[Dict[str, Any], Optional[datetime]], Event]:
+    event_type = data["event_type"]
+    deserializer = _DESERIALIZERS.get(event_type)
+    if deserializer is None:
+        raise ValueError(f"Unknown event type: {event_type}")
+    return deserializer
+
+def serialize_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a ShipAggregate.take_snapshot() result to a JSON-serializable dictionary."""
+    return {
+        "snapshot": True,
+        "ship_id": str(snapshot["ship_id"]),
+        "name": snapshot["name"],
+        "hull": [_plank_to_dict(p) for p in snapshot["hull"]],
+        "version": snapshot["version"],
+    }
+
+def deserialize_snapshot(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reconstruct a snapshot from its stored dictionary."""
+    return {
+        "ship_id": _ship_id(data["ship_id"]),
+        "name": data["name"],
+        "hull": [_plank_from_dict(p) for p in data["hull"]],
+        "version": data["version"],
+    }
+
+# Event files hold one JSON object per line, so they can be written and replayed one event at a time
+if orjson is not None:
+    def _dump_line(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data) + b"\n"
+    _load_line = orjson.loads
+else:
+    def _dump_line(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+    _load_line = json.loads
+
+# Example usage with file storage
+def save_events(ship: ShipAggregate, target: Union[str, BinaryIO], snapshot: bool = False) -> None:
+    """Write the ship's events, or with snapshot=True a single snapshot of its current state."""
+    if hasattr(target, "write"):
+        # Binary streams such as io.BytesIO get the whole log, with no fsync
+        target.write(_encode_records(ship, 0, snapshot))
+        return
+    path = os.path.abspath(target)
+    changes = ship._changes
+    saved_to = ship._saved_to
+    if not snapshot and saved_to is not None and saved_to[0] == path and _file_state(path) == saved_to[2]:
+        # The file is exactly as this ship last left it, so only the events recorded since are appended
+        mode, start = 'ab', saved_to[1]
+    else:
+        mode, start = 'wb', 0
+    with open(path, mode) as f:
+        f.write(_encode_records(ship, start, snapshot))
+        f.flush()
+        os.fsync(f.fileno())
+        st = os.fstat(f.fileno())
+    ship._saved_to = (path, len(changes), (st.st_ino, st.st_size, st.st_mtime_ns))
+
+def _file_state(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _encode_records(ship: ShipAggregate, start: int, snapshot: bool) -> bytes:
+    if snapshot:
+        return _dump_line(serialize_snapshot(ship.take_snapshot()))
+    return b"".join([_dump_line(serialize_event(e)) for e in ship._changes[start:]])
+
+def load_ship_from_file(source: Union[str, BinaryIO]) -> ShipAggregate:
+    """Rebuild a ship from its file or binary stream, starting from a leading snapshot record if there is one."""
+    if hasattr(source, "read"):
+        return _load_ship(source)
+    with open(source, 'rb') as f:
+        return _load_ship(f)
+
+def _load_ship(f: BinaryIO) -> ShipAggregate:
+    first = f.readline()
+    if first.lstrip().startswith(b"["):
+        # Older files store every event in a single JSON array
+        records = iter(json.loads(first + f.read()))
+    else:
+        records = (_load_line(line) for line in chain((first,), f) if line.strip())
+    head = next(records, None)
+    if head is not None and head.get("snapshot"):
+        # Only the events appended after the snapshot need replaying
+        tail = (_replay_event(data) for data in records)
+        return ShipAggregate.from_snapshot(deserialize_snapshot(head), tail)
+    if head is not None:
+        records = chain((head,), records)
+    # Replay only rebuilds state, so event timestamps are never parsed
+    return ShipAggregate.from_events(_replay_event(data) for data in records)
+
+def _append_lines(filename: str, buffer: List[bytes]) -> None:
+    """Append buffered lines to the file in one write and fsync it."""
+    if buffer:
+        with open(filename, 'ab') as f:
+            f.write(b"".join(buffer))
+            f.flush()
+            os.fsync(f.fileno())
+        buffer.clear()
+
+class EventLogWriter:
+    """Buffers events and appends them to an event file in batches, with one fsync per flush.
     
-    event_type = data.pop("event_type")
-    data["occurred_at"] = datetime.fromisoformat(data["occurred_at"])
+    Use it as a context manager, or call close(), so the last batch is written.
+    A writer that is dropped with events still buffered flushes them when it is collected.
+    """
     
-    # Convert string back to UUID
-    if "ship_id" in data:
-        data["ship_id"] = UUID(data["ship_id"])
+    def __init__(self, filename: str, batch_size: int = 100, flush_interval: Optional[float] = None):
+        self.filename = filename
+        self.batch_size = batch_size  # Flush once this many events are buffered
+        self.flush_interval = flush_interval  # Or once this many seconds have passed since the last flush
+        self._buffer: List[bytes] = []
+        self._last_flush = time.monotonic()
+        # Holds only the filename and buffer, so it doesn't keep the writer alive
+        self._finalizer = weakref.finalize(self, _append_lines, filename, self._buffer)
     
-    if event_type == "ShipLaunched":
-        data["initial_hull"] = [Plank(**p) for p in data["initial_hull"]]
-        return ShipLaunched(**data)
-    elif event_type == "PlankReplaced":
-        data["new_plank"] = Plank(**data["new_plank"])
-        return PlankReplaced(**data)
+    def append(self, event: Event) -> None:
+        """Buffer an event, flushing if the batch is full or the interval has elapsed."""
+        if not self._finalizer.alive:
+            raise ValueError("Cannot append to a closed EventLogWriter")
+        self._buffer.append(_dump_line(serialize_event(event)))
+        if len(self._buffer) >= self.batch_size or (
+            self.flush_interval is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
     
-    raise ValueError(f"Unknown event type: {event_type}")
-
-# Example usage with file storage
-def save_events(ship: ShipAggregate, filename: str) -> None:
-    events_data = [serialize_event(e) for e in ship._changes]
-    with open(filename, 'w') as f:
-        json.dump(events_data, f, indent=2)
-
-def load_ship_from_file(filename: str) -> ShipAggregate:
-    with open(filename, 'r') as f:
-        events_data = json.load(f)
-    events = [deserialize_event(data) for data in events_data]
-    return ShipAggregate.from_events(events)
\ No newline at end of file
+    def flush(self) -> None:
+        """Append all buffered events to the file in one write and fsync it."""
+        _append_lines(self.filename, self._buffer)
+        self._last_flush = time.monotonic()
+    
+    def close(self) -> None:
+        """Flush any buffered events; later appends raise ValueError."""
+        if self._finalizer.alive:
+            self.flush()
+            self._finalizer.detach()
+    
+    def __enter__(self) -> "EventLogWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,68 +1,123 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, Union, List
+from typing import Any, Dict, Iterable, Optional, Tuple, Union, List
 from uuid import UUID, uuid4
 
 # Reuse the Plank Value Object
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Plank:
     material: str
     length_cm: int
     width_cm: int
 
+# Source of event timestamps; tests can swap in a deterministic clock
+_clock = datetime.utcnow
+
 # --- Define Immutable Events ---
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShipLaunched:
     ship_id: UUID
     name: str
     initial_hull: List[Plank]
-    occurred_at: datetime = field(default_factory=datetime.utcnow)
+    occurred_at: datetime = field(default_factory=lambda: _clock())
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlankReplaced:
     ship_id: UUID
     plank_index: int
     new_plank: Plank
-    occurred_at: datetime = field(default_factory=datetime.utcnow)
+    occurred_at: datetime = field(default_factory=lambda: _clock())
 
 Event = Union[ShipLaunched, PlankReplaced]
 
 # --- Define the Aggregate ---
-@dataclass
+@dataclass(slots=True)
 class ShipAggregate:
     ship_id: UUID
     name: str
     hull: List[Plank]
     _changes: List[Event] = field(default_factory=list, repr=False)
+    _version: int = field(default=0, repr=False, compare=False)  # Number of events applied so far
+    # The PlankReplaced events in _changes, kept as they are recorded so projections skip the scan
+    _repairs: List[PlankReplaced] = field(default_factory=list, repr=False, compare=False)
+    # (file, number of _changes it holds) for the last file the events were saved to
+    _saved_to: Optional[Tuple[str, int, Tuple[int, int, int]]] = field(default=None, repr=False, compare=False)
     
     @classmethod
     def launch(cls, name: str, hull: List[Plank]) -> "ShipAggregate":
         """Create a new ship by recording a launch event."""
         ship_id = uuid4()
         event = ShipLaunched(ship_id, name, hull)
-        ship = cls(ship_id=ship_id, name=name, hull=list(hull))
+        ship = cls(ship_id=ship_id, name=name, hull=list(hull), _version=1)
         ship._changes.append(event)
         return ship
     
+    @property
+    def version(self) -> int:
+        """Number of events in the ship's history."""
+        return self._version
+    
     def replace_plank(self, index: int, new_plank: Plank) -> None:
         """Record the intent to replace a plank as an event."""
         event = PlankReplaced(self.ship_id, index, new_plank)
         self._apply(event)
         self._changes.append(event)
+        self._repairs.append(event)
     
     @classmethod
     def from_events(cls, events: Iterable[Event]) -> "ShipAggregate":
         """Reconstitute the ship's state by replaying its entire history."""
         ship = cls(ship_id=UUID('00000000-0000-0000-0000-000000000000'), name="", hull=[])
-        for e in events:
-            ship._apply(e)
+        ship._replay(events)
+        return ship
+    
+    def take_snapshot(self) -> Dict[str, Any]:
+        """Capture the current state so a later load can skip replaying the history so far."""
+        return {"ship_id": self.ship_id, "name": self.name, "hull": list(self.hull), "version": self._version}
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any], events: Iterable[Event] = ()) -> "ShipAggregate":
+        """Reconstitute the ship from a snapshot, replaying only the events recorded after it."""
+        ship = cls(ship_id=snapshot["ship_id"], name=snapshot["name"], hull=list(snapshot["hull"]),
+                   _version=snapshot["version"])
+        ship._replay(events)
         return ship
     
+    def _replay(self, events: Iterable[Event]) -> None:
+        get_handler = self._HANDLERS.get
+        version = self._version
+        hull = self.hull
+        for e in events:
+            if type(e) is PlankReplaced:
+                # Replacements dominate long histories, so apply them inline
+                hull[e.plank_index] = e.new_plank
+            else:
+                handler = get_handler(type(e))
+                if handler is None:
+                    continue
+                handler(self, e)
+                # A launch swaps in a new hull list
+                hull = self.hull
+            version += 1
+        self._version = version
+    
     def _apply(self, event: Event) -> None:
         """Apply an event to mutate the internal state."""
-        if isinstance(event, ShipLaunched):
-            self.ship_id = event.ship_id
-            self.name = event.name
-            self.hull = list(event.initial_hull)
-        elif isinstance(event, PlankReplaced):
-            self.hull[event.plank_index] = event.new_plank
\ No newline at end of file
+        handler = self._HANDLERS.get(type(event))
+        if handler is not None:
+            handler(self, event)
+            self._version += 1
+    
+    def _apply_ship_launched(self, event: ShipLaunched) -> None:
+        self.ship_id = event.ship_id
+        self.name = event.name
+        self.hull = list(event.initial_hull)
+    
+    def _apply_plank_replaced(self, event: PlankReplaced) -> None:
+        self.hull[event.plank_index] = event.new_plank
+    
+    # Handlers keyed by exact event type: one dict lookup per event instead of an isinstance chain
+    _HANDLERS = {
+        ShipLaunched: _apply_ship_launched,
+        PlankReplaced: _apply_plank_replaced,
+    }
@@ -11,8 +11,7 @@ This script demonstrates the concepts from the Ship of Theseus DDD article:
 """
 
 from uuid import uuid4
-import tempfile
-import os
+import argparse
 
 # Handle both direct execution and module import
 import sys
@@ -27,13 +26,11 @@ try:
     from .basic_entity_model import Ship, Plank
     from .event_sourced_model import ShipAggregate
     from .bounded_context_models import MaintenanceShip, FleetShipSpec
-    from .event_serialization import save_events, load_ship_from_file
 except ImportError:
     # Fallback for direct execution
     from basic_entity_model import Ship, Plank
     from event_sourced_model import ShipAggregate
     from bounded_context_models import MaintenanceShip, FleetShipSpec
-    from event_serialization import save_events, load_ship_from_file
 
 def demonstrate_basic_entity_model():
     """Demonstrate the basic Entity/Value Object pattern."""
@@ -41,7 +38,7 @@ def demonstrate_basic_entity_model():
     
     # Create a ship with planks
     ship_id = uuid4()
-    hull = [Plank("oak", 300, 30), Plank("oak", 300, 30)]
+    hull = [Plank("oak", 300, 30)] * 2
     ship = Ship(ship_id, "Theseus's Ship", hull)
     
     print(f"Original ship: {ship.name}")
@@ -62,7 +59,7 @@ def demonstrate_event_sourcing():
     print("=== Event Sourcing Pattern ===")
     
     # Create ship with event sourcing
-    hull = [Plank("oak", 300, 30), Plank("oak", 300, 30)]
+    hull = [Plank("oak", 300, 30)] * 2
     ship = ShipAggregate.launch("Theseus's Ship", hull)
     
     print(f"Ship launched: {ship.name}")
@@ -85,7 +82,7 @@ def demonstrate_bounded_contexts():
     print("=== Bounded Context Pattern ===")
     
     # Create a ship with some repair history
-    hull = [Plank("oak", 300, 40), Plank("oak", 300, 40)]
+    hull = [Plank("oak", 300, 40)] * 2
     ship = ShipAggregate.launch("HMS Victory", hull)
     ship.replace_plank(0, Plank("teak", 300, 40))  # Expensive upgrade
     
@@ -108,8 +105,16 @@ def demonstrate_event_persistence():
     """Demonstrate event serialization and persistence."""
     print("=== Event Persistence ===")
     
+    # Only this demo touches files, so runs that skip it don't pay for these imports
+    import tempfile
+    import os
+    try:
+        from .event_serialization import EventLogWriter, load_ship_from_file
+    except ImportError:
+        from event_serialization import EventLogWriter, load_ship_from_file
+    
     # Create ship with history
-    hull = [Plank("oak", 300, 30), Plank("oak", 300, 30)]
+    hull = [Plank("oak", 300, 30)] * 2
     original_ship = ShipAggregate.launch("Persistent Ship", hull)
     original_ship.replace_plank(0, Plank("teak", 300, 30))
     original_ship.replace_plank(1, Plank("mahogany", 300, 30))
@@ -119,7 +124,10 @@ def demonstrate_event_persistence():
         filename = f.name
     
     try:
-        save_events(original_ship, filename)
+        # Events are buffered and written with a single fsync when the writer closes
+        with EventLogWriter(filename) as event_log:
+            for event in original_ship._changes:
+                event_log.append(event)
         print(f"Saved {len(original_ship._changes)} events to file")
         
         # Load from file
@@ -137,7 +145,7 @@ def demonstrate_identity_as_narrative():
     """Demonstrate that identity depends on narrative, not just state."""
     print("=== Identity as Narrative ===")
     
-    initial_hull = [Plank("oak", 200, 30), Plank("oak", 200, 30)]
+    initial_hull = [Plank("oak", 200, 30)] * 2
     
     # Ship A: Replace planks in sequence 0, then 1
     ship_a = ShipAggregate.launch("Ship A", initial_hull)
@@ -160,16 +168,30 @@ def demonstrate_identity_as_narrative():
     
     print("Conclusion: Identity is not about final state, but about the story")
 
-def main():
-    """Run all demonstrations."""
+DEMOS = {
+    "basic": demonstrate_basic_entity_model,
+    "events": demonstrate_event_sourcing,
+    "contexts": demonstrate_bounded_contexts,
+    "persistence": demonstrate_event_persistence,
+    "narrative": demonstrate_identity_as_narrative,
+}
+
+def main(argv=None):
+    """Run the selected demonstrations, all of them by default."""
+    parser = argparse.ArgumentParser(description="Ship of Theseus DDD demonstrations")
+    parser.add_argument("--demos", default=",".join(DEMOS),
+                        help=f"comma-separated demos to run (default: all of {', '.join(DEMOS)})")
+    args = parser.parse_args(argv)
+    selected = [name.strip() for name in args.demos.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in DEMOS]
+    if unknown:
+        parser.error(f"unknown demo(s): {', '.join(unknown)}")
+    
     print("Ship of Theseus: Identity, Memory, and Context in Domain-Driven Design")
     print("=" * 70)
     
-    demonstrate_basic_entity_model()
-    demonstrate_event_sourcing()
-    demonstrate_bounded_contexts()
-    demonstrate_event_persistence()
-    demonstrate_identity_as_narrative()
+    for name in selected:
+        DEMOS[name]()
     
     print("\nConclusion:")
     print("The choice of how to model identity encodes our values:")
@@ -2,17 +2,25 @@ import pytest
 from .event_sourced_model import ShipAggregate, Plank
 from .bounded_context_models import MaintenanceShip, FleetShipSpec
 
+# Shared ships for tests that only read them; tests that record events build their own
+@pytest.fixture(scope="module")
+def victory_ship():
+    return ShipAggregate.launch("HMS Victory", [Plank("oak", 300, 40), Plank("oak", 300, 40)])
+
+@pytest.fixture(scope="module")
+def victory_with_teak():
+    ship = ShipAggregate.launch("HMS Victory", [Plank("oak", 300, 40), Plank("oak", 300, 40)])
+    ship.replace_plank(0, Plank("teak", 300, 40))  # Expensive upgrade
+    return ship
+
 class TestMaintenanceShip:
-    def test_maintenance_ship_creation(self):
+    def test_maintenance_ship_creation(self, victory_ship):
         """Test creating a maintenance view of a ship."""
-        hull = [Plank("oak", 300, 40), Plank("oak", 300, 40)]
-        ship_aggregate = ShipAggregate.launch("HMS Victory", hull)
-        
-        maintenance_ship = MaintenanceShip(ship_aggregate)
+        maintenance_ship = MaintenanceShip(victory_ship)
         
-        assert maintenance_ship.ship_id == ship_aggregate.ship_id
-        assert maintenance_ship.name == ship_aggregate.name
-        assert maintenance_ship.hull == ship_aggregate.hull
+        assert maintenance_ship.ship_id == victory_ship.ship_id
+        assert maintenance_ship.name == victory_ship.name
+        assert maintenance_ship.hull == victory_ship.hull
         assert len(maintenance_ship.repair_history) == 0
 
     def test_maintenance_ship_with_repairs(self):
@@ -27,14 +35,30 @@ class TestMaintenanceShip:
         assert len(maintenance_ship.repair_history) == 2
         assert maintenance_ship.needs_inspection() == True
 
-    def test_maintenance_ship_no_repairs_no_inspection(self):
+    def test_maintenance_ship_no_repairs_no_inspection(self, victory_ship):
         """Test that ships with no repairs don't need inspection."""
-        hull = [Plank("oak", 300, 40), Plank("oak", 300, 40)]
-        ship_aggregate = ShipAggregate.launch("New Ship", hull)
+        maintenance_ship = MaintenanceShip(victory_ship)
+        
+        assert maintenance_ship.needs_inspection() == False
+
+    def test_repair_history_is_a_point_in_time_view(self):
+        """Test that later repairs don't leak into an existing maintenance view."""
+        hull = [Plank("oak", 300, 40)]
+        ship_aggregate = ShipAggregate.launch("HMS Victory", hull)
+        ship_aggregate.replace_plank(0, Plank("teak", 300, 40))
         
         maintenance_ship = MaintenanceShip(ship_aggregate)
+        ship_aggregate.replace_plank(0, Plank("mahogany", 300, 40))
         
-        assert maintenance_ship.needs_inspection() == False
+        assert maintenance_ship.repair_history == ship_aggregate._changes[1:2]
+
+    def test_repair_history_is_built_on_first_access(self, victory_with_teak):
+        """Test that checking for inspection doesn't materialize the repair history."""
+        maintenance_ship = MaintenanceShip(victory_with_teak)
+        
+        assert maintenance_ship.needs_inspection() == True
+        assert "repair_history" not in vars(maintenance_ship)
+        assert maintenance_ship.repair_history == victory_with_teak._repairs
 
 class TestFleetShipSpec:
     def test_fleet_ship_spec_creation(self):
@@ -70,6 +94,20 @@ class TestFleetShipSpec:
         assert fleet_spec.cargo_capacity == 0
         assert fleet_spec.crew_size == 20
 
+    def test_fleet_ship_spec_follows_ship_changes(self):
+        """Test that the spec reflects the ship's current hull."""
+        hull = [Plank("teak", 300, 40), Plank("oak", 300, 40)]
+        ship_aggregate = ShipAggregate.launch("Test Ship", hull)
+        replayed = ShipAggregate.from_events(ship_aggregate._changes)
+        
+        ship_aggregate.replace_plank(1, Plank("teak", 300, 40))
+        replayed.replace_plank(0, Plank("oak", 300, 40))
+        assert FleetShipSpec.from_aggregate(ship_aggregate).cargo_capacity == 200
+        assert FleetShipSpec.from_aggregate(replayed).cargo_capacity == 0
+        
+        ship_aggregate.hull[0] = Plank("oak", 300, 40)
+        assert FleetShipSpec.from_aggregate(ship_aggregate).cargo_capacity == 100
+
     def test_fleet_ship_spec_immutability(self):
         """Test that FleetShipSpec is immutable."""
         hull = [Plank("teak", 300, 40)]
@@ -80,14 +118,10 @@ class TestFleetShipSpec:
             fleet_spec.cargo_capacity = 500
 
 class TestBoundedContextDemonstration:
-    def test_bounded_context_modeling(self):
+    def test_bounded_context_modeling(self, victory_with_teak):
         """Shows how the same ship appears differently across contexts."""
-        # Create a ship with rich history
-        ship = ShipAggregate.launch("HMS Victory", [
-            Plank("oak", 300, 40),
-            Plank("oak", 300, 40)
-        ])
-        ship.replace_plank(0, Plank("teak", 300, 40))  # Expensive upgrade
+        # A ship with rich history
+        ship = victory_with_teak
         
         maintenance_view = MaintenanceShip(ship)
         fleet_view = FleetShipSpec.from_aggregate(ship)
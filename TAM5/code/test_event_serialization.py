@@ -1,10 +1,15 @@
 import pytest
+import gc
+import io
 import json
 import tempfile
 import os
 from datetime import datetime
 from uuid import UUID
-from .event_serialization import serialize_event, deserialize_event, save_events, load_ship_from_file
+from .event_serialization import (
+    serialize_event, deserialize_event, serialize_snapshot, save_events, load_ship_from_file,
+    EventLogWriter
+)
 from .event_sourced_model import ShipAggregate, ShipLaunched, PlankReplaced, Plank
 
 class TestEventSerialization:
@@ -34,6 +39,26 @@ class TestEventSerialization:
         assert serialized["new_plank"]["material"] == "mahogany"
         assert isinstance(serialized["occurred_at"], str)
 
+    def test_serialize_matches_stored_layout(self):
+        ship_id = UUID('12345678-1234-5678-1234-567812345678')
+        occurred_at = datetime(2024, 1, 2, 3, 4, 5)
+        event = ShipLaunched(ship_id, "Test Ship", [Plank("oak", 300, 30)], occurred_at)
+        
+        serialized = serialize_event(event)
+        
+        assert serialized == {
+            "ship_id": str(ship_id),
+            "name": "Test Ship",
+            "initial_hull": [{"material": "oak", "length_cm": 300, "width_cm": 30}],
+            "occurred_at": "2024-01-02T03:04:05",
+            "event_type": "ShipLaunched",
+        }
+        assert list(serialized) == ["ship_id", "name", "initial_hull", "occurred_at", "event_type"]
+
+    def test_serialize_unknown_event_raises_error(self):
+        with pytest.raises(ValueError, match="Unknown event type: Plank"):
+            serialize_event(Plank("oak", 300, 30))
+
     def test_deserialize_ship_launched_event(self):
         ship_id = UUID('12345678-1234-5678-1234-567812345678')
         occurred_at = datetime.now()
@@ -76,6 +101,47 @@ class TestEventSerialization:
         assert event.new_plank == Plank("mahogany", 280, 32)
         assert event.occurred_at == occurred_at
 
+    def test_deserialized_planks_are_shared(self):
+        ship_id = UUID('12345678-1234-5678-1234-567812345678')
+        plank = {"material": "oak", "length_cm": 300, "width_cm": 30}
+        data = {
+            "event_type": "ShipLaunched",
+            "ship_id": str(ship_id),
+            "name": "Test Ship",
+            "initial_hull": [dict(plank), dict(plank)],
+            "occurred_at": datetime.now().isoformat()
+        }
+        
+        event = deserialize_event(data)
+        
+        assert event.initial_hull[0] is event.initial_hull[1]
+
+    def test_deserialized_ship_ids_are_shared(self):
+        ship_id = UUID('12345678-1234-5678-1234-567812345678')
+        events = [
+            deserialize_event(serialize_event(PlankReplaced(ship_id, i, Plank("oak", 300, 30))))
+            for i in range(2)
+        ]
+        
+        assert events[0].ship_id == ship_id
+        assert events[0].ship_id is events[1].ship_id
+
+    def test_deserialize_leaves_input_unchanged(self):
+        event = PlankReplaced(UUID('12345678-1234-5678-1234-567812345678'), 0, Plank("oak", 300, 30))
+        data = serialize_event(event)
+        stored = json.loads(json.dumps(data))
+        
+        assert deserialize_event(data) == event
+        assert data == stored
+
+    def test_deserialized_events_can_be_serialized_again(self):
+        event = PlankReplaced(UUID('12345678-1234-5678-1234-567812345678'), 0, Plank("oak", 300, 30))
+        
+        replayed = deserialize_event(serialize_event(event))
+        
+        assert isinstance(replayed.occurred_at, datetime)
+        assert serialize_event(replayed) == serialize_event(event)
+
     def test_unknown_event_type_raises_error(self):
         data = {
             "event_type": "UnknownEvent",
@@ -105,72 +171,241 @@ class TestEventSerialization:
 
 class TestFilePersistence:
     def test_save_and_load_ship(self):
-        """Test saving ship events to file and loading them back."""
+        """Test saving ship events to a stream and loading them back."""
         # Create a ship with some history
         hull = [Plank("oak", 300, 30), Plank("oak", 300, 30)]
         ship = ShipAggregate.launch("Theseus", hull)
         ship.replace_plank(0, Plank("teak", 300, 30))
         ship.replace_plank(1, Plank("mahogany", 300, 30))
         
-        # Save to temporary file
+        buf = io.BytesIO()
+        save_events(ship, buf)
+        buf.seek(0)
+        loaded_ship = load_ship_from_file(buf)
+        
+        # Verify the loaded ship matches the original
+        assert loaded_ship.ship_id == ship.ship_id
+        assert loaded_ship.name == ship.name
+        assert loaded_ship.hull == ship.hull
+
+    def test_save_events_creates_valid_json(self):
+        """Test that saved events are valid JSON, one event per line."""
+        hull = [Plank("oak", 300, 30)]
+        ship = ShipAggregate.launch("Test Ship", hull)
+        ship.replace_plank(0, Plank("teak", 300, 30))
+        
+        buf = io.BytesIO()
+        save_events(ship, buf)
+        
+        # Verify every line is a valid JSON event
+        data = [json.loads(line) for line in buf.getvalue().splitlines()]
+        
+        assert len(data) == 2  # ShipLaunched + PlankReplaced
+        assert all("event_type" in event for event in data)
+
+    def test_empty_ship_serialization(self):
+        """Test serializing a ship with no changes."""
+        ship = ShipAggregate.from_events([])
+        
+        buf = io.BytesIO()
+        save_events(ship, buf)
+        
+        assert buf.getvalue() == b""  # No events
+        buf.seek(0)
+        assert load_ship_from_file(buf).hull == []
+
+    def test_load_legacy_json_array(self):
+        """Test loading a file written as a single JSON array of events."""
+        hull = [Plank("oak", 300, 30)]
+        ship = ShipAggregate.launch("Theseus", hull)
+        ship.replace_plank(0, Plank("teak", 300, 30))
+        
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump([serialize_event(e) for e in ship._changes], f, indent=2)
             filename = f.name
         
         try:
-            save_events(ship, filename)
+            loaded_ship = load_ship_from_file(filename)
+            
+            assert loaded_ship.ship_id == ship.ship_id
+            assert loaded_ship.hull == ship.hull
+        
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
+
+    def test_load_snapshot_with_later_events(self):
+        """Test loading a snapshot file with events appended after it."""
+        hull = [Plank("oak", 300, 30), Plank("oak", 300, 30)]
+        ship = ShipAggregate.launch("Theseus", hull)
+        ship.replace_plank(0, Plank("teak", 300, 30))
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            filename = f.name
+        
+        try:
+            save_events(ship, filename, snapshot=True)
+            with open(filename, 'r') as f:
+                assert [json.loads(line) for line in f] == [serialize_snapshot(ship.take_snapshot())]
+            
+            ship.replace_plank(1, Plank("mahogany", 300, 30))
+            with open(filename, 'a') as f:
+                f.write(json.dumps(serialize_event(ship._changes[-1])) + "\n")
             
-            # Load back from file
             loaded_ship = load_ship_from_file(filename)
             
-            # Verify the loaded ship matches the original
             assert loaded_ship.ship_id == ship.ship_id
             assert loaded_ship.name == ship.name
             assert loaded_ship.hull == ship.hull
+            assert loaded_ship.version == 3
         
         finally:
-            # Clean up
             if os.path.exists(filename):
                 os.unlink(filename)
 
-    def test_save_events_creates_valid_json(self):
-        """Test that saved events are valid JSON."""
-        hull = [Plank("oak", 300, 30)]
-        ship = ShipAggregate.launch("Test Ship", hull)
-        ship.replace_plank(0, Plank("teak", 300, 30))
+    def test_repeated_saves_append_new_events(self):
+        """Test that saving to the same file again appends only the new events."""
+        ship = ShipAggregate.launch("Theseus", [Plank("oak", 300, 30)])
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
             filename = f.name
         
         try:
+            save_events(ship, filename, snapshot=True)
+            ship.replace_plank(0, Plank("teak", 300, 30))
+            save_events(ship, filename)
+            ship.replace_plank(0, Plank("mahogany", 300, 30))
             save_events(ship, filename)
             
-            # Verify file contains valid JSON
             with open(filename, 'r') as f:
-                data = json.load(f)
+                records = [json.loads(line) for line in f]
+            
+            assert [r.get("event_type") for r in records] == [None, "PlankReplaced", "PlankReplaced"]
+            assert load_ship_from_file(filename).hull == ship.hull
             
-            assert isinstance(data, list)
-            assert len(data) == 2  # ShipLaunched + PlankReplaced
-            assert all("event_type" in event for event in data)
+            # A different file gets the whole history
+            other = filename + ".copy"
+            save_events(ship, other)
+            with open(other, 'r') as f:
+                assert len(f.readlines()) == 3
+            os.unlink(other)
         
         finally:
             if os.path.exists(filename):
                 os.unlink(filename)
 
-    def test_empty_ship_serialization(self):
-        """Test serializing a ship with no changes."""
-        ship = ShipAggregate.from_events([])
+    def test_save_rewrites_file_changed_since_last_save(self):
+        """Test that a file written by another ship or truncated is rewritten, not appended to."""
+        one = ShipAggregate.launch("One", [Plank("oak", 300, 30)])
+        two = ShipAggregate.launch("Two", [Plank("oak", 300, 30), Plank("oak", 300, 30)])
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
             filename = f.name
         
         try:
-            save_events(ship, filename)
+            save_events(one, filename)
+            save_events(two, filename)
+            one.replace_plank(0, Plank("teak", 300, 30))
+            save_events(one, filename)
+            
+            loaded_ship = load_ship_from_file(filename)
+            assert loaded_ship.name == "One"
+            assert loaded_ship.hull == [Plank("teak", 300, 30)]
+            
+            open(filename, 'w').close()
+            one.replace_plank(0, Plank("mahogany", 300, 30))
+            save_events(one, filename)
+            
+            assert load_ship_from_file(filename).hull == [Plank("mahogany", 300, 30)]
+        
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
+
+class TestEventLogWriter:
+    def test_events_are_written_on_flush(self):
+        """Test that appended events stay buffered until the writer flushes."""
+        hull = [Plank("oak", 300, 30)]
+        ship = ShipAggregate.launch("Theseus", hull)
+        ship.replace_plank(0, Plank("teak", 300, 30))
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            filename = f.name
+        
+        try:
+            with EventLogWriter(filename) as event_log:
+                for event in ship._changes:
+                    event_log.append(event)
+                assert os.path.getsize(filename) == 0
+            
+            loaded_ship = load_ship_from_file(filename)
+            
+            assert loaded_ship.ship_id == ship.ship_id
+            assert loaded_ship.hull == ship.hull
+        
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
+
+    def test_full_batch_is_flushed(self):
+        """Test that reaching batch_size appends the batch to the file."""
+        ship = ShipAggregate.launch("Theseus", [Plank("oak", 300, 30)])
+        ship.replace_plank(0, Plank("teak", 300, 30))
+        ship.replace_plank(0, Plank("mahogany", 300, 30))
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            filename = f.name
+        
+        try:
+            event_log = EventLogWriter(filename, batch_size=2)
+            for event in ship._changes:
+                event_log.append(event)
             
             with open(filename, 'r') as f:
-                data = json.load(f)
+                assert len(f.readlines()) == 2
             
-            assert data == []  # No events
+            event_log.flush()
+            assert load_ship_from_file(filename).hull == ship.hull
         
         finally:
             if os.path.exists(filename):
-                os.unlink(filename)
\ No newline at end of file
+                os.unlink(filename)
+
+    def test_dropped_writer_flushes_buffered_events(self):
+        """Test that events buffered in a writer that is never closed still reach the file."""
+        ship = ShipAggregate.launch("Theseus", [Plank("oak", 300, 30)])
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            filename = f.name
+        
+        try:
+            event_log = EventLogWriter(filename)
+            event_log.append(ship._changes[0])
+            del event_log
+            gc.collect()
+            
+            assert load_ship_from_file(filename).ship_id == ship.ship_id
+        
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
+
+    def test_closed_writer_rejects_appends(self):
+        """Test that close() flushes and later appends fail."""
+        ship = ShipAggregate.launch("Theseus", [Plank("oak", 300, 30)])
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            filename = f.name
+        
+        try:
+            event_log = EventLogWriter(filename)
+            event_log.append(ship._changes[0])
+            event_log.close()
+            
+            assert load_ship_from_file(filename).ship_id == ship.ship_id
+            with pytest.raises(ValueError):
+                event_log.append(ship._changes[0])
+        
+        finally:
+            if os.path.exists(filename):
+                os.unlink(filename)
@@ -1,6 +1,8 @@
 import pytest
 from datetime import datetime, timedelta
+from itertools import count
 from uuid import UUID
+from . import event_sourced_model
 from .event_sourced_model import (
     ShipAggregate,
     ShipLaunched,
@@ -44,6 +46,29 @@ class TestEventSourcingModel:
         assert reconstructed.name == original_ship.name
         assert reconstructed.hull == original_ship.hull
 
+    def test_snapshot_reconstruction(self):
+        """Test that a snapshot plus the later events rebuilds the same ship."""
+        hull = [Plank("oak", 300, 30), Plank("oak", 300, 30)]
+        original_ship = ShipAggregate.launch("Theseus", hull)
+        original_ship.replace_plank(0, Plank("teak", 300, 30))
+        snapshot = original_ship.take_snapshot()
+        original_ship.replace_plank(1, Plank("mahogany", 300, 30))
+
+        reconstructed = ShipAggregate.from_snapshot(snapshot, original_ship._changes[2:])
+
+        assert snapshot["version"] == 2
+        assert reconstructed.ship_id == original_ship.ship_id
+        assert reconstructed.hull == original_ship.hull
+        assert reconstructed.version == original_ship.version == 3
+
+    def test_equality_ignores_version(self):
+        """Test that ships with the same state compare equal whatever version they are at."""
+        ship = ShipAggregate.launch("Theseus", [Plank("oak", 300, 30)])
+        snapshot = ship.take_snapshot()
+        snapshot["version"] = 7
+
+        assert ShipAggregate.from_snapshot(snapshot) == ShipAggregate.from_snapshot(ship.take_snapshot())
+
     def test_identity_is_narrative(self):
         """Demonstrates that identity depends on history, not just final state."""
         initial_hull = [Plank("oak", 200, 30), Plank("oak", 200, 30)]
@@ -101,24 +126,22 @@ class TestPlankReplacedEvent:
 
 
 class TestEventOrdering:
-    def test_events_maintain_order(self):
+    def test_events_maintain_order(self, monkeypatch):
         """Test that events are processed in chronological order."""
+        # A ticking clock gives every event a distinct timestamp without sleeping
+        ticks = count()
+        monkeypatch.setattr(event_sourced_model, "_clock",
+                            lambda: datetime(2024, 1, 1) + timedelta(milliseconds=next(ticks)))
         hull = [Plank("oak", 300, 30), Plank("oak", 300, 30)]
         ship = ShipAggregate.launch("Test Ship", hull)
-
-        # Add some delay between events to ensure different timestamps
-        import time
-
-        time.sleep(0.001)
         ship.replace_plank(0, Plank("teak", 300, 30))
-        time.sleep(0.001)
         ship.replace_plank(1, Plank("mahogany", 300, 30))
 
         # Verify events are in chronological order
         events = ship._changes
         assert len(events) == 3
         for i in range(1, len(events)):
-            assert events[i - 1].occurred_at <= events[i].occurred_at
+            assert events[i - 1].occurred_at < events[i].occurred_at
 
     def test_empty_event_stream_reconstruction(self):
         """Test reconstruction from empty event stream."""
@@ -127,3 +150,27 @@ class TestEventOrdering:
         assert ship.ship_id == UUID("00000000-0000-0000-0000-000000000000")
         assert ship.name == ""
         assert ship.hull == []
+
+    def test_unknown_events_are_ignored_on_replay(self):
+        """Test that replay skips events the aggregate has no handler for."""
+        ship = ShipAggregate.launch("Test Ship", [Plank("oak", 300, 30)])
+        events = [ship._changes[0], Plank("teak", 300, 30)]
+
+        rebuilt = ShipAggregate.from_events(events)
+
+        assert rebuilt.ship_id == ship.ship_id
+        assert rebuilt.hull == [Plank("oak", 300, 30)]
+
+    def test_replacements_after_a_later_launch_apply_to_its_hull(self):
+        """Test that replay follows the hull of the most recent launch."""
+        first = ShipAggregate.launch("First", [Plank("oak", 300, 30)])
+        first.replace_plank(0, Plank("teak", 300, 30))
+        second = ShipAggregate.launch("Second", [Plank("pine", 300, 30)])
+        second.replace_plank(0, Plank("mahogany", 300, 30))
+
+        rebuilt = ShipAggregate.from_events(first._changes + second._changes)
+
+        assert rebuilt.name == "Second"
+        assert rebuilt.hull == [Plank("mahogany", 300, 30)]
+        assert first.hull == [Plank("teak", 300, 30)]
+        assert rebuilt.version == 4